@@ -3,23 +3,34 @@ from tkinter import ttk, messagebox
 from tkinter import font
 import json
 import os
+import sys
 import csv
-import threading
-import time
+import importlib.util
+import queue
+import heapq
+import bisect
+import math
+import textwrap
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
-from matplotlib.colors import LinearSegmentedColormap
+from collections import defaultdict, namedtuple
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import seaborn as sns
 
-# Try to import system notification libraries
+# matplotlib/seaborn are imported on first use by load_plot_libs()
+plt = sns = Figure = FigureCanvasTkAgg = LinearSegmentedColormap = None
+# Shared chart formatters/colormap, also created by load_plot_libs()
+RUPEE_FORMATTER = RUPEE_K_FORMATTER = DAILY_CMAP = None
+
+# System notifications need plyer; it is only imported when a notification is shown
+NOTIFICATIONS_AVAILABLE = importlib.util.find_spec('plyer') is not None
+
+# Try to import the faster orjson serializer
 try:
-    import plyer
-    NOTIFICATIONS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    NOTIFICATIONS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Import AI modules
 try:
@@ -31,9 +42,228 @@ except ImportError as e:
     print(f"AI features not available: {e}")
     AI_FEATURES_AVAILABLE = False
 
-# Set modern styling for matplotlib
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+# Files live next to the application
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_FILE = os.path.join(APP_DIR, "expenses.json")
+JOURNAL_FILE = os.path.join(APP_DIR, "expenses.jsonl")
+SETTINGS_FILE = os.path.join(APP_DIR, "settings.json")
+
+# Category choices for the add form and the transactions filter
+CATEGORIES = ("🍕 Food", "🚗 Transportation", "🎬 Entertainment",
+              "📱 Bills", "🏥 Healthcare",
+              "📚 Education", "🛍️ Shopping", "📦 Other")
+# Transactions sort options -> (column, reverse); columns are sorted with np.argsort
+SORT_KEYS = {
+    "Date (Recent)": ('date', True),
+    "Date (Oldest)": ('date', False),
+    "Amount (High to Low)": ('amount', True),
+    "Amount (Low to High)": ('amount', False),
+    "Category": ('category', False),
+}
+
+# Deletes are written out together once no further change has happened for this long
+COMPACT_DELAY_MS = 5 * 1000
+
+# How often the Tk thread checks whether an AI worker result is ready
+FUTURE_POLL_MS = 50
+
+# AI suggestions panel refresh interval, and the slower one while it is collapsed or minimized
+AI_REFRESH_MS = 30 * 1000
+AI_IDLE_REFRESH_MS = 120 * 1000
+
+# Settings saved in quick succession are written to disk once, this long after the last save
+SETTINGS_SAVE_DELAY_MS = 200
+
+# How often the notification service re-checks budget and weekly reminders
+NOTIFICATION_CHECK_MS = 60 * 1000
+# How often the Tk thread drains the toast queue
+TOAST_POLL_MS = 100
+
+# Dated notification keys (e.g. daily_budget_YYYY-MM-DD) older than this are forgotten
+NOTIFICATION_HISTORY_DAYS = 30
+
+# Transaction counts that trigger an achievement notification
+COUNT_ACHIEVEMENTS = {
+    10: "First 10 transactions recorded!",
+    50: "50 transactions milestone reached!",
+    100: "Century of transactions achieved!",
+    500: "500 transactions - You're a tracking pro!",
+    1000: "1000 transactions - Financial master!",
+}
+
+# Total-amount milestones, announced once when the total comes within 100 of them
+AMOUNT_ACHIEVEMENTS = (
+    (10000, "₹10,000 total expenses tracked!"),
+    (50000, "₹50,000 spending milestone!"),
+    (100000, "₹1,00,000 - Major spending milestone!"),
+    (500000, "₹5,00,000 tracked - Big spender!"),
+)
+# Sorted milestone amounts for bisect, and milestone -> message
+AMOUNT_MILESTONES = tuple(sorted(milestone for milestone, _ in AMOUNT_ACHIEVEMENTS))
+AMOUNT_MESSAGES = dict(AMOUNT_ACHIEVEMENTS)
+# Past both of these nothing can fire, so check_achievements returns immediately
+MAX_COUNT_ACHIEVEMENT = max(COUNT_ACHIEVEMENTS)
+MAX_AMOUNT_ACHIEVEMENT = AMOUNT_MILESTONES[-1]
+
+# One AI panel / urgent alert suggestion; action is None when there is nothing to click
+Suggestion = namedtuple('Suggestion', 'type title message priority icon action', defaults=(None,))
+
+# Characters per line for suggestion and urgent alert messages, wrapped once with textwrap
+SUGGESTION_WRAP_CHARS = 55
+URGENT_WRAP_CHARS = 45
+
+# Suggestion card (accent, background) colours by priority
+SUGGESTION_PALETTE = {
+    'danger': ('#e74c3c', '#fdf2f2'),
+    'warning': ('#f39c12', '#fef9e7'),
+    'success': ('#27ae60', '#f0f9f4'),
+    'info': ('#3498db', '#eff8ff')
+}
+
+# AI recommendation priority -> (suggestion priority, icon)
+RECOMMENDATION_STYLE = {
+    'high': ('danger', '🚨'),
+    'medium': ('warning', '💡'),
+    'low': ('info', 'ℹ️')
+}
+
+# Separator under the AI insights report title
+REPORT_RULE = "=" * 50
+
+# Plain category names as stored in expenses.json
+CATEGORY_NAMES = tuple(c.split(' ', 1)[1] for c in CATEGORIES)
+# Plain name -> emoji-prefixed display string, and the reverse lookups
+DISPLAY_CATEGORY = dict(zip(CATEGORY_NAMES, CATEGORIES))
+CATEGORY_FROM_DISPLAY = dict(zip(CATEGORIES, CATEGORY_NAMES))
+CATEGORY_FROM_EMOJI = {c.split(' ', 1)[0]: name for c, name in zip(CATEGORIES, CATEGORY_NAMES)}
+FILTER_OPTIONS = ("All", "🍕 Food", "🚗 Transportation", "🎬 Entertainment",
+                  "🛍️ Shopping", "📱 Bills", "🏥 Healthcare", "📚 Education", "📦 Other")
+
+# Static text shown in the smart categorization settings window
+CATEGORIZATION_STATUS_TEXT = (
+    "🏷️ SMART CATEGORIZATION STATUS\n"
+    + "=" * 40 + "\n\n"
+    "✅ AI Categorization: ACTIVE\n"
+    "📊 Learning Mode: Enabled\n"
+    "🎯 Accuracy: Improving with each transaction\n\n"
+    "FEATURES:\n"
+    "• Machine Learning categorization\n"
+    "• Keyword-based fallback system\n"
+    "• User feedback learning\n"
+    "• Continuous improvement\n\n"
+    "HOW IT WORKS:\n"
+    "1. AI analyzes expense description and amount\n"
+    "2. Suggests most likely category\n"
+    "3. Learns from your feedback\n"
+    "4. Improves accuracy over time\n\n"
+    "CATEGORIES AVAILABLE:\n"
+    "• Food\n"
+    "• Transportation\n"
+    "• Entertainment\n"
+    "• Shopping\n"
+    "• Bills\n"
+    "• Healthcare\n"
+    "• Education\n"
+    "• Other\n"
+)
+
+def load_plot_libs():
+    """Import the plotting libraries and apply the modern chart styling (only the first call does work)"""
+    global plt, sns, Figure, FigureCanvasTkAgg, LinearSegmentedColormap
+    global RUPEE_FORMATTER, RUPEE_K_FORMATTER, DAILY_CMAP
+    if plt is not None:
+        return
+    
+    import matplotlib.pyplot as pyplot
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg as canvas_class
+    from matplotlib.figure import Figure as figure_class
+    from matplotlib.colors import LinearSegmentedColormap as cmap_class
+    import seaborn
+    
+    # Set modern styling for matplotlib
+    pyplot.style.use('seaborn-v0_8-darkgrid')
+    seaborn.set_palette("husl")
+    
+    # Built once instead of on every redraw
+    RUPEE_FORMATTER = pyplot.FuncFormatter(lambda x, _: f'₹{x:,.0f}')
+    RUPEE_K_FORMATTER = pyplot.FuncFormatter(lambda x, _: f'₹{x/1000:.0f}k' if x >= 1000 else f'₹{x:.0f}')
+    # Soft blue gradient
+    DAILY_CMAP = cmap_class.from_list("soft_grad", ["#74b9ff", "#0984e3", "#2d3436"])
+    
+    sns, Figure, FigureCanvasTkAgg, LinearSegmentedColormap = seaborn, figure_class, canvas_class, cmap_class
+    plt = pyplot
+
+def load_json_file(path):
+    """Read a JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def dump_json_file(path, data):
+    """Write data to a JSON file with 2-space indentation, replacing the old file atomically"""
+    tmp_path = path + '.tmp'
+    if ORJSON_AVAILABLE:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def parse_day(date_str):
+    """Convert a YYYY-MM-DD string to datetime64[D], NaT if it doesn't parse"""
+    try:
+        return np.datetime64(date_str, 'D')
+    except ValueError:
+        return np.datetime64('NaT', 'D')
+
+def intern_expense(expense):
+    """Intern the heavily repeated string fields so all records share one copy of each value"""
+    expense['date'] = sys.intern(expense['date'])
+    expense['category'] = sys.intern(expense['category'])
+    return expense
+
+def notification_key_date(key):
+    """Return the YYYY-MM-DD suffix of a notification key, or None for undated keys"""
+    suffix = key.rsplit('_', 1)[-1]
+    if len(suffix) == 10 and suffix[4] == '-' and suffix[7] == '-':
+        return suffix
+    return None
+
+def display_row(expense):
+    """Treeview values for an expense: date, formatted amount, emoji category, description"""
+    return (
+        expense['date'],
+        f"₹{expense['amount']:.2f}",
+        # Add emoji to category for display
+        DISPLAY_CATEGORY.get(expense['category'], expense['category']),
+        expense['description']
+    )
+
+def append_json_line(path, record):
+    """Append a single record to a JSON-Lines file"""
+    if ORJSON_AVAILABLE:
+        line = orjson.dumps(record) + b'\n'
+    else:
+        line = json.dumps(record).encode('utf-8') + b'\n'
+    with open(path, 'ab') as f:
+        f.write(line)
+
+def load_json_lines(path):
+    """Read all records from a JSON-Lines file, skipping torn or invalid lines"""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    records = []
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                records.append(loads(line))
+            except ValueError:
+                continue  # Partially written line from an interrupted append
+    return records
 
 class ExpenseTracker:
     def __init__(self, root):
@@ -41,6 +271,9 @@ class ExpenseTracker:
         self.root.title("💰 Professional Expense Tracker")
         self.root.geometry("1200x800")
         self.root.configure(bg='#f8f9fa')
+        # Screen size, read once for centering dialogs
+        self._screen_w = self.root.winfo_screenwidth()
+        self._screen_h = self.root.winfo_screenheight()
         self.root.minsize(1000, 600)
         
         # Modern color scheme
@@ -62,26 +295,65 @@ class ExpenseTracker:
         # Configure modern ttk style
         self.configure_styles()
         
+        # Warm up the JSON codec so the first data/settings load doesn't pay the cold-start cost
+        json.dumps(None)
+        if ORJSON_AVAILABLE:
+            orjson.dumps(None)
+
         # Data file path
-        self.data_file = os.path.join(os.path.dirname(__file__), "expenses.json")
+        self.data_file = DATA_FILE
+        # Append-only journal of expenses added since the last full save
+        self.journal_file = JOURNAL_FILE
         
         # Initialize data
+        self._journal_dirty = False
+        self._compact_after_id = None
+        self.corrupt_data_backup = None
         self.expenses = self.load_data()
+        if self.corrupt_data_backup:
+            messagebox.showwarning("Data File Unreadable",
+                                   f"{self.data_file} could not be read and was moved to\n"
+                                   f"{self.corrupt_data_backup}\n\nOnly expenses added since the last save are shown.")
+        # Parallel NumPy columns (struct-of-arrays) for vectorized aggregation
+        self._rebuild_soa()
+        # Running total, kept in sync by add_expense/delete_expense
+        self._total_amount = math.fsum(self._amounts)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Views waiting for the coalesced repaint; non-empty means one is scheduled
+        self._ui_dirty = set()
+        # Row id -> (values, tag) currently shown in the transactions tree
+        self._rendered_rows = {}
+        # Same for the recent expenses tree
+        self._rendered_recent = {}
         
         # Initialize AI components
         self.ai_categorizer = None
         self.financial_ai = None
         self.dashboard = None
+        # Urgent AI alert banner, built on the first alert and hidden between alerts
+        self._urgent_banner = None
+        self._urgent_after_id = None
         
         if AI_FEATURES_AVAILABLE:
             self.ai_categorizer = AIExpenseCategorizer()
+            # Categorization runs off the Tk thread so a slow model can't freeze the form
+            self._ai_executor = ThreadPoolExecutor(max_workers=1)
             self.financial_ai = FinancialAI()
             self.dashboard = RealTimeDashboard(self.root, self.get_expense_data)
         
         # Notification settings
         self.notifications_enabled = True
         self.daily_budget = 1000  # Default daily budget
-        self.notification_history = []
+        self._settings_pending = None
+        self._settings_after_id = None
+        # Notification settings dialog, built on first open and hidden between uses
+        self._settings_window = None
+        # Keys of alerts already shown; dated keys expire after NOTIFICATION_HISTORY_DAYS
+        self.notification_history = set()
+        
+        # Toasts can be queued from any thread; the Tk thread polls and shows them
+        self._notif_q = queue.SimpleQueue()
+        self._toast_after_id = self.root.after(TOAST_POLL_MS, self._drain_toasts)
         
         # Load notification settings
         self.load_notification_settings()
@@ -89,7 +361,10 @@ class ExpenseTracker:
         # Start notification service
         self.start_notification_service()
         
-        # Create main interface
+        # Create main interface (the chart figure is created lazily)
+        self.fig = None
+        # Set when the chart is out of date because the analytics tab wasn't showing
+        self._analytics_dirty = True
         self.create_widgets()
         self.refresh_transactions()
         self.update_graph()
@@ -121,6 +396,20 @@ class ExpenseTracker:
                        relief='solid',
                        borderwidth=1)
         
+        # AI suggestion card styles, one set per priority (e.g. Danger.SuggestionCard.TFrame)
+        for priority, (accent, bg) in SUGGESTION_PALETTE.items():
+            name = priority.title()
+            style.configure(f'{name}.SuggestionCard.TFrame', background=bg, relief='solid', borderwidth=1)
+            style.configure(f'{name}.Suggestion.TFrame', background=bg)
+            style.configure(f'{name}.SuggestionAccent.TFrame', background=accent)
+            style.configure(f'{name}.SuggestionTitle.TLabel', background=bg, foreground=accent,
+                           font=('Segoe UI', 10, 'bold'))
+            style.configure(f'{name}.SuggestionMessage.TLabel', background=bg,
+                           foreground=self.colors['dark'], font=('Segoe UI', 9))
+            style.configure(f'{name}.Suggestion.TButton', background=accent, foreground='white',
+                           font=('Segoe UI', 8, 'bold'), relief='flat', padding=(10, 2))
+            style.map(f'{name}.Suggestion.TButton', background=[('active', accent)])
+        
         # Configure combobox styles
         style.configure('Modern.TCombobox',
                        fieldbackground=self.colors['white'],
@@ -146,23 +435,176 @@ class ExpenseTracker:
                  foreground=[('selected', self.colors['white'])])
         
     def load_data(self):
-        """Load expenses from JSON file, create if doesn't exist"""
+        """Load expenses from JSON file plus the append journal, create if doesn't exist"""
+        snapshot_ok = True
         if os.path.exists(self.data_file):
             try:
-                with open(self.data_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return []
+                expenses = load_json_file(self.data_file)
+            except (OSError, ValueError):
+                expenses = None
+            if not isinstance(expenses, list):
+                # Never overwrite an unreadable snapshot; keep it for manual recovery
+                snapshot_ok = False
+                expenses = []
+                self.corrupt_data_backup = f"{self.data_file}.corrupt-{datetime.now():%Y%m%d-%H%M%S}"
+                os.replace(self.data_file, self.corrupt_data_backup)
+                print(f"Unreadable {self.data_file} moved to {self.corrupt_data_backup}")
         else:
             # Create empty JSON file
-            with open(self.data_file, 'w') as f:
-                json.dump([], f)
-            return []
+            dump_json_file(self.data_file, [])
+            expenses = []
+        
+        # Replay expenses appended since the last full save
+        if os.path.exists(self.journal_file):
+            journal = load_json_lines(self.journal_file)
+            expenses.extend(journal)
+            # Fold them into the JSON file, unless the snapshot was lost and the journal is all that is left
+            if snapshot_ok:
+                if journal:
+                    dump_json_file(self.data_file, expenses)
+                os.remove(self.journal_file)
+        
+        for expense in expenses:
+            intern_expense(expense)
+        return expenses
     
     def save_data(self):
-        """Save expenses to JSON file"""
-        with open(self.data_file, 'w') as f:
-            json.dump(self.expenses, f, indent=2)
+        """Save all expenses to JSON file and clear the append journal"""
+        dump_json_file(self.data_file, self.expenses)
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+        self._journal_dirty = False
+    
+    def append_expense(self, expense):
+        """Persist a single new expense by appending it to the journal"""
+        append_json_line(self.journal_file, expense)
+        self._journal_dirty = True
+    
+    def _rebuild_soa(self):
+        """Rebuild the amount/date/category columns from self.expenses"""
+        self._amounts = np.array([e['amount'] for e in self.expenses], dtype=np.float64)
+        self._days = np.array([parse_day(e['date']) for e in self.expenses], dtype='datetime64[D]')
+        # Categories are stored as small integer codes; unknown names get a new code on first sight
+        self._category_names = list(CATEGORY_NAMES)
+        self._category_codes = {name: i for i, name in enumerate(self._category_names)}
+        self._cat_codes = np.array([self._category_code(e['category']) for e in self.expenses], dtype=np.int16)
+        # Month key (YYYY-MM) -> indices into self.expenses
+        self._by_month = defaultdict(list)
+        for i, expense in enumerate(self.expenses):
+            self._index_expense(i, expense)
+        # Month key -> (amounts, category codes, days) slices, filled on demand by _month_columns
+        self._month_cache = {}
+        # (filter, sort) -> ordered expense indices, filled on demand by _view_order
+        self._view_cache = {}
+        # Formatted Treeview values per expense, so refreshes don't re-format every row
+        self._row_values = [display_row(e) for e in self.expenses]
+        # (description, amount, category) rows for retraining, built on first retrain
+        self._training_rows = None
+        # Pending or finished AI insights analysis, shared until the expenses change
+        self._insights_future = None
+        # Per-date and per-category spending, updated incrementally on add/delete
+        self._daily_totals = defaultdict(float)
+        self._category_totals = defaultdict(float)
+        for expense in self.expenses:
+            self._daily_totals[expense['date']] += expense['amount']
+            self._category_totals[expense['category']] += expense['amount']
+    
+    def _category_code(self, name):
+        """Return the integer code for a category name, assigning one if needed"""
+        code = self._category_codes.get(name)
+        if code is None:
+            code = self._category_codes[name] = len(self._category_names)
+            self._category_names.append(name)
+        return code
+    
+    def _month_columns(self, month_key):
+        """Return the cached (amounts, category codes, days) slices for a YYYY-MM month"""
+        columns = self._month_cache.get(month_key)
+        if columns is None:
+            month_idx = np.array(self._by_month.get(month_key, ()), dtype=np.intp)
+            columns = self._month_cache[month_key] = (
+                self._amounts[month_idx], self._cat_codes[month_idx], self._days[month_idx])
+        return columns
+    
+    def _index_expense(self, i, expense):
+        """Record expense index i under its month key"""
+        self._by_month[expense['date'][:7]].append(i)
+    
+    def _append_soa(self, expense):
+        """Append one expense to the parallel columns"""
+        self._amounts = np.append(self._amounts, float(expense['amount']))
+        self._days = np.append(self._days, parse_day(expense['date']))
+        self._cat_codes = np.append(self._cat_codes, np.int16(self._category_code(expense['category'])))
+        self._index_expense(len(self._amounts) - 1, expense)
+        self._month_cache.pop(expense['date'][:7], None)
+        self._view_cache = {}
+        self._insights_future = None
+        self._row_values.append(display_row(expense))
+        if self._training_rows is not None:
+            self._training_rows.append((expense['description'], expense['amount'], expense['category']))
+        self._daily_totals[expense['date']] += expense['amount']
+        self._category_totals[expense['category']] += expense['amount']
+    
+    def _delete_soa(self, index, expense):
+        """Remove the expense at index from the parallel columns"""
+        self._amounts = np.delete(self._amounts, index)
+        self._days = np.delete(self._days, index)
+        self._cat_codes = np.delete(self._cat_codes, index)
+        # Re-sum the affected totals instead of subtracting, so no float residue is left behind
+        code = self._category_codes[expense['category']]
+        self._category_totals[expense['category']] = math.fsum(self._amounts[self._cat_codes == code])
+        day = parse_day(expense['date'])
+        if np.isnat(day):
+            self._daily_totals[expense['date']] -= expense['amount']
+        else:
+            self._daily_totals[expense['date']] = math.fsum(self._amounts[self._days == day])
+        del self._row_values[index]
+        if self._training_rows is not None:
+            del self._training_rows[index]
+        # Later indices shift down by one, so rebuild the month index
+        self._by_month = defaultdict(list)
+        for i, expense in enumerate(self.expenses):
+            self._index_expense(i, expense)
+        self._month_cache = {}
+        self._view_cache = {}
+        self._insights_future = None
+    
+    def schedule_compaction(self):
+        """Rewrite the JSON file after COMPACT_DELAY_MS, folding repeated changes into one write"""
+        self._journal_dirty = True
+        if self._compact_after_id is not None:
+            self.root.after_cancel(self._compact_after_id)
+        self._compact_after_id = self.root.after(COMPACT_DELAY_MS, self._compact)
+    
+    def _compact(self):
+        """Run the write scheduled by schedule_compaction"""
+        self._compact_after_id = None
+        self.save_data()
+    
+    def on_close(self):
+        """Compact the journal into the JSON file and close the application"""
+        # The window is destroyed even if saving fails, so the app can always be closed
+        try:
+            if self._compact_after_id is not None:
+                self.root.after_cancel(self._compact_after_id)
+            if self._journal_dirty:
+                try:
+                    self.save_data()
+                except OSError as e:
+                    messagebox.showerror("❌ Error", f"Could not save expenses: {e}")
+            if self._settings_after_id is not None:
+                self.root.after_cancel(self._settings_after_id)
+                self._settings_after_id = None
+                try:
+                    dump_json_file(SETTINGS_FILE, self._settings_pending)
+                except OSError as e:
+                    messagebox.showerror("❌ Error", f"Could not save settings: {e}")
+            if AI_FEATURES_AVAILABLE:
+                self._ai_executor.shutdown(wait=False)
+            self.root.after_cancel(self._notif_after_id)
+            self.root.after_cancel(self._toast_after_id)
+        finally:
+            self.root.destroy()
     
     def create_widgets(self):
         """Create the main GUI widgets with modern design"""
@@ -181,6 +623,7 @@ class ExpenseTracker:
         self.create_add_expense_tab()
         self.create_view_expenses_tab()
         self.create_analytics_tab()
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
         
         # Add AI features tab if available
         if AI_FEATURES_AVAILABLE:
@@ -223,21 +666,21 @@ class ExpenseTracker:
                                relief='flat', cursor='hand2', width=3)
         notif_button.pack(side='right', padx=(10, 0))
         
-        total_expenses = sum(expense['amount'] for expense in self.expenses)
         total_transactions = len(self.expenses)
         
         self.quick_total_label = tk.Label(stats_frame,
-                                         text=f"₹{total_expenses:,.2f}",
+                                         text=f"₹{self._total_amount:,.2f}",
                                          font=('Segoe UI', 16, 'bold'),
                                          fg=self.colors['warning'],
                                          bg=self.colors['primary'])
         self.quick_total_label.pack()
         
-        tk.Label(stats_frame,
-                text=f"Total Expenses ({total_transactions} transactions)",
-                font=('Segoe UI', 10),
-                fg=self.colors['light'],
-                bg=self.colors['primary']).pack()
+        self.quick_txn_label = tk.Label(stats_frame,
+                                       text=f"Total Expenses ({total_transactions} transactions)",
+                                       font=('Segoe UI', 10),
+                                       fg=self.colors['light'],
+                                       bg=self.colors['primary'])
+        self.quick_txn_label.pack()
     
     def create_add_expense_tab(self):
         """Create the add expense tab with modern card-based design"""
@@ -290,13 +733,10 @@ class ExpenseTracker:
         # Category field
         self.create_form_field(form_content, "🏷️ Category:", 2)
         self.category_var = tk.StringVar()
-        categories = ["🍕 Food", "🚗 Transportation", "🎬 Entertainment",
-                      "📱 Bills", "🏥 Healthcare", 
-                      "📚 Education", "🛍️ Shopping", "📦 Other"]
         category_frame = tk.Frame(form_content, bg=self.colors['white'])
         category_frame.grid(row=2, column=1, sticky='ew', padx=(10, 0), pady=10)
         self.category_combo = ttk.Combobox(category_frame, textvariable=self.category_var, 
-                                          values=categories, style='Modern.TCombobox',
+                                          values=CATEGORIES, style='Modern.TCombobox',
                                           font=('Segoe UI', 11))
         self.category_combo.pack(fill='x', ipady=8)
         
@@ -317,13 +757,14 @@ class ExpenseTracker:
         button_frame = tk.Frame(left_frame, bg=self.colors['white'])
         button_frame.pack(fill='x', padx=20, pady=(0, 20))
         
-        add_button = tk.Button(button_frame, text="✨ Add Expense", 
-                              command=self.add_expense,
-                              bg=self.colors['success'], fg=self.colors['white'], 
-                              font=('Segoe UI', 12, 'bold'),
-                              relief='flat', cursor='hand2',
-                              activebackground=self.colors['secondary'])
-        add_button.pack(fill='x', ipady=12)
+        # Kept so it can be disabled while an AI category suggestion is pending
+        self.add_button = tk.Button(button_frame, text="✨ Add Expense", 
+                                    command=self.add_expense,
+                                    bg=self.colors['success'], fg=self.colors['white'], 
+                                    font=('Segoe UI', 12, 'bold'),
+                                    relief='flat', cursor='hand2',
+                                    activebackground=self.colors['secondary'])
+        self.add_button.pack(fill='x', ipady=12)
         
         # Right side - Recent expenses
         right_frame = ttk.Frame(main_container, style='Card.TFrame')
@@ -367,6 +808,10 @@ class ExpenseTracker:
         recent_scrollbar.pack(side='right', fill='y')
         self.recent_tree.configure(yscrollcommand=recent_scrollbar.set)
         
+        # Configure row colors
+        self.recent_tree.tag_configure('evenrow', background='#f8f9fa')
+        self.recent_tree.tag_configure('oddrow', background='#ffffff')
+        
     def create_form_field(self, parent, label_text, row):
         """Create a form field with modern styling"""
         label = tk.Label(parent, text=label_text, 
@@ -406,13 +851,12 @@ class ExpenseTracker:
         tk.Label(sort_frame, text="Sort by:", font=('Segoe UI', 11, 'bold'),
                 bg=self.colors['white'], fg=self.colors['dark']).pack(anchor='w')
         self.sort_var = tk.StringVar(value="Date (Recent)")
-        sort_options = ["Date (Recent)", "Date (Oldest)", "Amount (High to Low)", 
-                       "Amount (Low to High)", "Category"]
+        sort_options = list(SORT_KEYS)
         self.sort_combo = ttk.Combobox(sort_frame, textvariable=self.sort_var, 
                                       values=sort_options, style='Modern.TCombobox',
                                       width=18, font=('Segoe UI', 10))
         self.sort_combo.pack(pady=(5, 0), ipady=5)
-        self.sort_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_transactions())
+        self.sort_combo.bind('<<ComboboxSelected>>', lambda e: self.request_refresh('transactions'))
         
         # Category filter
         filter_frame = tk.Frame(controls_row, bg=self.colors['white'])
@@ -421,13 +865,11 @@ class ExpenseTracker:
         tk.Label(filter_frame, text="Filter by Category:", font=('Segoe UI', 11, 'bold'),
                 bg=self.colors['white'], fg=self.colors['dark']).pack(anchor='w')
         self.filter_var = tk.StringVar(value="All")
-        filter_options = ["All", "🍕 Food", "🚗 Transportation", "🎬 Entertainment", 
-                         "🛍️ Shopping", "📱 Bills", "🏥 Healthcare", "📚 Education", "📦 Other"]
         self.filter_combo = ttk.Combobox(filter_frame, textvariable=self.filter_var, 
-                                        values=filter_options, style='Modern.TCombobox',
+                                        values=FILTER_OPTIONS, style='Modern.TCombobox',
                                         width=18, font=('Segoe UI', 10))
         self.filter_combo.pack(pady=(5, 0), ipady=5)
-        self.filter_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_transactions())
+        self.filter_combo.bind('<<ComboboxSelected>>', lambda e: self.request_refresh('transactions'))
         
         # Action buttons
         button_frame = tk.Frame(controls_row, bg=self.colors['white'])
@@ -488,6 +930,10 @@ class ExpenseTracker:
         trans_scrollbar.pack(side='right', fill='y')
         self.transactions_tree.configure(yscrollcommand=trans_scrollbar.set)
         
+        # Configure row colors
+        self.transactions_tree.tag_configure('evenrow', background='#f8f9fa')
+        self.transactions_tree.tag_configure('oddrow', background='#ffffff')
+        
         # Summary card
         summary_card = ttk.Frame(main_container, style='Card.TFrame')
         summary_card.pack(fill='x')
@@ -578,8 +1024,35 @@ class ExpenseTracker:
         charts_content = tk.Frame(charts_card, bg=self.colors['white'])
         charts_content.pack(fill='both', expand=True, padx=20, pady=20)
         
-        # Create optimized matplotlib figure
-        self.fig = Figure(figsize=(12, 8), dpi=100, facecolor='white')
+        # The figure itself is built the first time the tab is shown
+        self.analytics_frame = analytics_frame
+        self.charts_content = charts_content
+        
+    def _on_tab_changed(self, event=None):
+        """Handle notebook tab switches"""
+        if self._analytics_visible():
+            if self.fig is None:
+                self.build_charts()
+            if self._analytics_dirty:
+                self.update_graph()
+        elif (AI_FEATURES_AVAILABLE and not self._ai_tab_built
+              and self.notebook.select() == str(self.ai_features_frame)):
+            self.build_ai_features_tab()
+    
+    def _analytics_visible(self):
+        """Return True if the analytics tab is the selected one"""
+        return self.notebook.select() == str(self.analytics_frame)
+    
+    def build_charts(self):
+        """Create the matplotlib figure, canvas and toolbar for the analytics tab"""
+        load_plot_libs()
+        charts_content = self.charts_content
+        
+        # Set modern style once; every chart artist is created after this
+        plt.style.use('seaborn-v0_8-whitegrid')
+        
+        # Create optimized matplotlib figure (screen DPI keeps the Agg buffer small)
+        self.fig = Figure(figsize=(12, 8), dpi=72, facecolor='white', tight_layout=False)
         self.fig.patch.set_facecolor('white')
         
         self.canvas = FigureCanvasTkAgg(self.fig, charts_content)
@@ -593,6 +1066,27 @@ class ExpenseTracker:
         toolbar.config(bg=self.colors['white'])
         toolbar.update()
         
+        # Axes are created by _chart_axes and reused across refreshes
+        self._chart_has_data = None
+        
+    def _chart_axes(self, has_data):
+        """Return the chart axes; the figure is only rebuilt when the data/no-data layout flips"""
+        if has_data == self._chart_has_data:
+            return self._axes
+        
+        self.fig.clear()
+        self._chart_has_data = has_data
+        self._weekly_bars = None
+        if has_data:
+            # Create a clean 1x2 grid layout with equal column widths
+            gs = self.fig.add_gridspec(1, 2, width_ratios=[1, 1], 
+                                       hspace=0.3, wspace=0.4,
+                                       left=0.08, right=0.95, top=0.85, bottom=0.15)
+            self._axes = [self.fig.add_subplot(gs[0, 0]), self.fig.add_subplot(gs[0, 1])]
+        else:
+            self._axes = [self.fig.add_subplot(1, 1, 1)]
+        return self._axes
+        
     def export_data(self):
         """Export expense data to CSV"""
         try:
@@ -610,12 +1104,14 @@ class ExpenseTracker:
             )
             
             if file_path:
-                with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                    fieldnames = ['date', 'amount', 'category', 'description', 'timestamp']
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    for expense in self.expenses:
-                        writer.writerow(expense)
+                fieldnames = ['date', 'amount', 'category', 'description', 'timestamp']
+                rows = [(e['date'], e['amount'], e['category'], e.get('description', ''), e.get('timestamp', ''))
+                        for e in self.expenses]
+                # Large buffer + a single writerows call keeps per-row overhead down
+                with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                    writer = csv.writer(csvfile)
+                    writer.writerow(fieldnames)
+                    writer.writerows(rows)
                 
                 # Show success notifications
                 self.show_toast_notification("📊 Export Complete", f"Data exported to {os.path.basename(file_path)}", "success")
@@ -638,112 +1134,123 @@ class ExpenseTracker:
                 return
             
             description = self.description_var.get() or "No description"
+            date = self.date_var.get()
             
             # Use AI categorization if available and category not manually selected
             category = self.category_var.get()
             if (not category or category == "Select category") and AI_FEATURES_AVAILABLE and self.ai_categorizer:
-                # Try AI categorization
-                suggested_category = self.ai_categorizer.smart_categorize(description, amount)
-                
-                # Ask user if they want to use the suggestion
-                if suggested_category and suggested_category != "Other":
-                    result = messagebox.askyesno(
-                        "🤖 AI Suggestion", 
-                        f"AI suggests category: '{suggested_category}'\n\nUse this suggestion?",
-                        icon='question'
-                    )
-                    if result:
-                        category = suggested_category
-                        # Train the AI with user's acceptance
-                        self.ai_categorizer.learn_from_feedback(description, amount, suggested_category, True)
-                    else:
-                        # Let user choose manually
-                        category = self.category_var.get()
-                        if not category or category == "Select category":
-                            messagebox.showerror("❌ Error", "Please select a category")
-                            return
-                        # Train the AI with user's rejection and correct choice
-                        self.ai_categorizer.learn_from_feedback(description, amount, category, False)
-                else:
-                    if not category or category == "Select category":
-                        messagebox.showerror("❌ Error", "Please select a category")
-                        return
+                # Categorize in the background and finish adding once the suggestion is back;
+                # the Add button stays disabled meanwhile so extra clicks can't add duplicates
+                self.show_toast_notification("🤖 Categorizing", "Finding the best category for this expense...", "info")
+                self.add_button.config(state='disabled')
+                future = self._ai_executor.submit(self.ai_categorizer.smart_categorize, description, amount)
+                self._after_future(future, self._apply_suggestion, date, amount, category, description)
+                return
             elif not category or category == "Select category":
                 messagebox.showerror("❌ Error", "Please select a category")
                 return
             
-            # Clean category (remove emoji if present)
-            if category.startswith('🍕'):
-                category = "Food"
-            elif category.startswith('🚗'):
-                category = "Transportation"
-            elif category.startswith('🎬'):
-                category = "Entertainment"
-            elif category.startswith('🛍️'):
-                category = "Shopping"
-            elif category.startswith('📱'):
-                category = "Bills"
-            elif category.startswith('🏥'):
-                category = "Healthcare"
-            elif category.startswith('📚'):
-                category = "Education"
-            elif category.startswith('📦'):
-                category = "Other"
-            
-            # Create expense entry
-            expense = {
-                "date": self.date_var.get(),
-                "amount": amount,
-                "category": category,
-                "description": description,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            # Add to expenses list
-            self.expenses.append(expense)
-            self.save_data()
-            
-            # Clear form
-            self.amount_var.set("")
-            self.description_var.set("")
-            
-            # Update header stats
-            self.update_header_stats()
-            
-            # Refresh displays
-            self.refresh_transactions()
-            self.refresh_recent_expenses()
-            self.update_graph()
-            
-            # Check for achievements
-            self.check_achievements()
-            
-            # Check daily budget
-            self.check_daily_budget()
-            
-            # Show success notification
-            self.show_toast_notification("✅ Success", "Expense added successfully!", "success")
-            messagebox.showinfo("✅ Success", "Expense added successfully!")
-            
-            # Update AI suggestions after adding expense
-            if AI_FEATURES_AVAILABLE and hasattr(self, 'suggestions_container'):
-                self.root.after(500, self.update_ai_suggestions)
-                # Check for urgent alerts
-                self.root.after(1000, self.check_for_urgent_alerts)
+            self._save_new_expense(date, amount, category, description)
             
         except ValueError:
             messagebox.showerror("❌ Error", "Please enter a valid amount")
     
+    def _after_future(self, future, callback, *args):
+        """Call callback(future, *args) on the Tk thread once future is done, polling so workers never touch Tk"""
+        if future.done():
+            callback(future, *args)
+        else:
+            self.root.after(FUTURE_POLL_MS, self._after_future, future, callback, *args)
+    
+    def _apply_suggestion(self, future, date, amount, category, description):
+        """Ask the user about the AI category suggestion, then add the expense"""
+        try:
+            self._resolve_suggestion(future, date, amount, category, description)
+        finally:
+            self.add_button.config(state='normal')
+    
+    def _resolve_suggestion(self, future, date, amount, category, description):
+        """Pick the category from the AI suggestion and the form value given at submit time"""
+        try:
+            suggested_category, _confidence = future.result()
+        except Exception as e:
+            print(f"AI categorization error: {e}")
+            suggested_category = None
+        
+        # Ask user if they want to use the suggestion
+        if suggested_category and suggested_category != "Other":
+            result = messagebox.askyesno(
+                "🤖 AI Suggestion", 
+                f"AI suggests category: '{suggested_category}'\n\nUse this suggestion?",
+                icon='question'
+            )
+            if result:
+                category = suggested_category
+                # Train the AI with user's acceptance
+                self.ai_categorizer.learn_from_feedback(description, amount, suggested_category, True)
+            else:
+                # Let user choose manually
+                if not category or category == "Select category":
+                    messagebox.showerror("❌ Error", "Please select a category")
+                    return
+                # Train the AI with user's rejection and correct choice
+                self.ai_categorizer.learn_from_feedback(description, amount, category, False)
+        else:
+            if not category or category == "Select category":
+                messagebox.showerror("❌ Error", "Please select a category")
+                return
+        
+        self._save_new_expense(date, amount, category, description)
+    
+    def _save_new_expense(self, date, amount, category, description):
+        """Store a validated expense and refresh everything that depends on it"""
+        # Clean category (remove emoji if present)
+        category = CATEGORY_FROM_EMOJI.get(category.split(' ', 1)[0], category)
+        
+        # Create expense entry
+        expense = intern_expense({
+            "date": date,
+            "amount": amount,
+            "category": category,
+            "description": description,
+            "timestamp": datetime.now().isoformat()
+        })
+        
+        # Add to expenses list
+        self.expenses.append(expense)
+        self._total_amount += amount
+        self._append_soa(expense)
+        self.append_expense(expense)
+        
+        # Clear form
+        self.amount_var.set("")
+        self.description_var.set("")
+        
+        # Update header stats and displays (coalesced into one repaint)
+        self.request_refresh('header', 'transactions', 'recent', 'graph')
+        
+        # Check for achievements
+        self.check_achievements()
+        
+        # Check daily budget
+        self.check_daily_budget()
+        
+        # Show success notification
+        self.show_toast_notification("✅ Success", "Expense added successfully!", "success")
+        messagebox.showinfo("✅ Success", "Expense added successfully!")
+        
+        # Update AI suggestions after adding expense
+        if AI_FEATURES_AVAILABLE and hasattr(self, 'suggestions_container'):
+            self.root.after(500, self.update_ai_suggestions)
+            # Check for urgent alerts
+            self.root.after(1000, self.check_for_urgent_alerts)
+    
     def update_header_stats(self):
         """Update the header statistics"""
-        total_expenses = sum(expense['amount'] for expense in self.expenses)
         total_transactions = len(self.expenses)
         
-        self.quick_total_label.config(text=f"₹{total_expenses:,.2f}")
-        # Update the transactions count label if it exists
-        for widget in self.quick_total_label.master.winfo_children():
-            if isinstance(widget, tk.Label) and "transactions" in widget.cget("text"):
-                widget.config(text=f"Total Expenses ({total_transactions} transactions)")
+        self.quick_total_label.config(text=f"₹{self._total_amount:,.2f}")
+        self.quick_txn_label.config(text=f"Total Expenses ({total_transactions} transactions)")
     
     def delete_expense(self):
         """Delete selected expense with enhanced feedback"""
@@ -753,168 +1260,155 @@ class ExpenseTracker:
             return
         
         if messagebox.askyesno("🗑️ Confirm Deletion", "Are you sure you want to delete this expense?\n\nThis action cannot be undone."):
-            # Get the index of the selected item
-            item = self.transactions_tree.item(selected[0])
-            date = item['values'][0]
-            amount_str = item['values'][1].replace('₹', '').replace(',', '')
-            amount = float(amount_str)
-            category_full = item['values'][2]
-            # Extract category name (remove emoji)
-            category = category_full.split(' ', 1)[-1] if ' ' in category_full else category_full
-            description = item['values'][3]
+            # Row ids are indices into self.expenses (see refresh_transactions)
+            i = int(selected[0])
+            expense = self.expenses.pop(i)
+            self._delete_soa(i, expense)
+            # Re-sum rather than subtract so the running total can't drift
+            self._total_amount = math.fsum(self._amounts)
             
-            # Find and remove the expense
-            for i, expense in enumerate(self.expenses):
-                if (expense['date'] == date and 
-                    expense['amount'] == amount and 
-                    expense['category'] == category and 
-                    expense['description'] == description):
-                    del self.expenses[i]
-                    break
+            self.schedule_compaction()
+            self.request_refresh('header', 'transactions', 'recent', 'graph')
             
-            self.save_data()
+            # Show deletion notification
+            self.show_toast_notification("🗑️ Deleted", "Expense deleted successfully!", "info")
+            messagebox.showinfo("✅ Success", "Expense deleted successfully!")
+    
+    def request_refresh(self, *kinds):
+        """Mark views ('header', 'transactions', 'recent', 'graph') dirty and repaint them once the event loop is idle"""
+        if not self._ui_dirty:
+            self.root.after_idle(self._do_refresh)
+        self._ui_dirty.update(kinds)
+    
+    def _do_refresh(self):
+        """Run the repaint scheduled by request_refresh, once per dirty view"""
+        kinds, self._ui_dirty = self._ui_dirty, set()
+        if 'header' in kinds:
             self.update_header_stats()
+        if 'transactions' in kinds:
             self.refresh_transactions()
+        if 'recent' in kinds:
             self.refresh_recent_expenses()
+        if 'graph' in kinds:
             self.update_graph()
-            
-            # Show deletion notification
-            self.show_toast_notification("🗑️ Deleted", "Expense deleted successfully!", "info")
-            messagebox.showinfo("✅ Success", "Expense deleted successfully!")
     
     def refresh_transactions(self):
         """Refresh the transactions view with sorting and filtering"""
-        # Clear existing items
-        for item in self.transactions_tree.get_children():
-            self.transactions_tree.delete(item)
-        
-        # Get filtered expenses
-        filtered_expenses = self.expenses.copy()
-        
-        # Apply category filter (handle emoji categories)
+        # Get filtered, sorted expenses, keeping each one's index into self.expenses as its row id
         filter_value = self.filter_var.get()
-        if filter_value != "All":
-            # Convert emoji category to plain category
-            category_map = {
-                "🍕 Food": "Food",
-                "🚗 Transportation": "Transportation", 
-                "🎬 Entertainment": "Entertainment",
-                "🛍️ Shopping": "Shopping",
-                "📱 Bills": "Bills",
-                "🏥 Healthcare": "Healthcare",
-                "📚 Education": "Education",
-                "📦 Other": "Other"
-            }
-            target_category = category_map.get(filter_value, filter_value)
-            filtered_expenses = [e for e in filtered_expenses if e['category'] == target_category]
-        
-        # Apply sorting
-        sort_option = self.sort_var.get()
-        if sort_option == "Date (Recent)":
-            filtered_expenses.sort(key=lambda x: x['date'], reverse=True)
-        elif sort_option == "Date (Oldest)":
-            filtered_expenses.sort(key=lambda x: x['date'])
-        elif sort_option == "Amount (High to Low)":
-            filtered_expenses.sort(key=lambda x: x['amount'], reverse=True)
-        elif sort_option == "Amount (Low to High)":
-            filtered_expenses.sort(key=lambda x: x['amount'])
-        elif sort_option == "Category":
-            filtered_expenses.sort(key=lambda x: x['category'])
-        
-        # Populate treeview with alternating row colors
-        total_amount = 0
-        for i, expense in enumerate(filtered_expenses):
-            # Add emoji to category for display
-            display_category = expense['category']
-            category_emojis = {
-                "Food": "🍕",
-                "Transportation": "🚗",
-                "Entertainment": "🎬",
-                "Shopping": "🛍️",
-                "Bills": "📱",
-                "Healthcare": "🏥",
-                "Education": "📚",
-                "Other": "📦"
-            }
-            if display_category in category_emojis:
-                display_category = f"{category_emojis[display_category]} {display_category}"
-            
-            item_id = self.transactions_tree.insert('', 'end', values=(
-                expense['date'],
-                f"₹{expense['amount']:.2f}",
-                display_category,
-                expense['description']
-            ))
-            
-            # Alternate row colors
-            if i % 2 == 0:
-                self.transactions_tree.item(item_id, tags=('evenrow',))
-            else:
-                self.transactions_tree.item(item_id, tags=('oddrow',))
-                
-            total_amount += expense['amount']
+        view = self._view_order(filter_value, self.sort_var.get())
+        if filter_value == "All":
+            total_amount = self._total_amount
+        else:
+            total_amount = self._category_totals.get(CATEGORY_FROM_DISPLAY.get(filter_value, filter_value), 0)
         
-        # Configure row colors
-        self.transactions_tree.tag_configure('evenrow', background='#f8f9fa')
-        self.transactions_tree.tag_configure('oddrow', background='#ffffff')
+        # Build the rows to show, with alternating row colors
+        rows = {}
+        order = []
+        for i, idx in enumerate(view):
+            iid = str(idx)
+            rows[iid] = (self._row_values[idx], 'evenrow' if i % 2 == 0 else 'oddrow')
+            order.append(iid)
+        
+        # Only touch the rows that changed since the last refresh
+        self._sync_tree(self.transactions_tree, self._rendered_rows, rows, order)
+        self._rendered_rows = rows
         
         # Update summary
         self.total_label.config(text=f"💰 Total Expenses: ₹{total_amount:,.2f}")
-        self.count_label.config(text=f"📊 Transactions: {len(filtered_expenses)}")
+        self.count_label.config(text=f"📊 Transactions: {len(view)}")
         
         # Update AI suggestions when data changes
         if AI_FEATURES_AVAILABLE and hasattr(self, 'suggestions_container'):
             self.root.after(1000, self.update_ai_suggestions)  # Delay to avoid too frequent updates
     
-    def refresh_recent_expenses(self):
-        """Refresh the recent expenses view in add tab with enhanced display"""
-        # Clear existing ite
-        for item in self.recent_tree.get_children():
-            self.recent_tree.delete(item)
-        
-        # Get recent expenses (last 8)
-        recent_expenses = sorted(self.expenses, key=lambda x: x['timestamp'], reverse=True)[:8]
-        
-        # Populate treeview with enhanced formatting
-        for i, expense in enumerate(recent_expenses):
-            # Add emoji to category for display
-            display_category = expense['category']
-            category_emojis = {
-                "Food": "🍕",
-                "Transportation": "🚗",
-                "Entertainment": "🎬",
-                "Shopping": "🛍️",
-                "Bills": "📱",
-                "Healthcare": "🏥",
-                "Education": "📚",
-                "Other": "📦"
-            }
-            if display_category in category_emojis:
-                display_category = f"{category_emojis[display_category]} {display_category}"
-            
-            item_id = self.recent_tree.insert('', 'end', values=(
-                expense['date'],
-                f"₹{expense['amount']:.2f}",
-                display_category,
-                expense['description']
-            ))
-            
-            # Alternate row colors
-            if i % 2 == 0:
-                self.recent_tree.item(item_id, tags=('evenrow',))
+    def _view_order(self, filter_value, sort_option):
+        """Return the expense indices for a filter/sort combination, memoized until the data changes"""
+        view_key = (filter_value, sort_option)
+        order = self._view_cache.get(view_key)
+        if order is not None:
+            return order
+        
+        # Apply category filter (handle emoji categories and match on category codes)
+        if filter_value == "All":
+            order = np.arange(len(self.expenses))
+        else:
+            # Convert emoji category to plain category
+            target_category = CATEGORY_FROM_DISPLAY.get(filter_value, filter_value)
+            code = self._category_codes.get(target_category)
+            order = np.flatnonzero(self._cat_codes == code) if code is not None else np.empty(0, dtype=np.intp)
+        
+        # Apply sorting with a stable argsort on the matching column
+        sort_key = SORT_KEYS.get(sort_option)
+        if sort_key:
+            column, reverse = sort_key
+            values = self._sort_values(column)[order]
+            if reverse:
+                # Descending but still stable: argsort the reversed column and map positions back
+                positions = (len(values) - 1 - np.argsort(values[::-1], kind='stable'))[::-1]
             else:
-                self.recent_tree.item(item_id, tags=('oddrow',))
+                positions = np.argsort(values, kind='stable')
+            order = order[positions]
         
-        # Configure row colors
-        self.recent_tree.tag_configure('evenrow', background='#f8f9fa')
-        self.recent_tree.tag_configure('oddrow', background='#ffffff')
+        order = self._view_cache[view_key] = order.tolist()
+        return order
+    
+    def _sort_values(self, column):
+        """Return a numeric array that sorts like the given expense field"""
+        if column == 'date':
+            return self._days.astype(np.int64)
+        if column == 'amount':
+            return self._amounts
+        # Category: alphabetical rank of each code's name
+        names = self._category_names
+        rank = np.empty(len(names), dtype=np.intp)
+        rank[sorted(range(len(names)), key=names.__getitem__)] = np.arange(len(names))
+        return rank[self._cat_codes]
+    
+    def _sync_tree(self, tree, rendered, rows, order):
+        """Bring tree from the rendered rows to the new rows with the fewest insert/delete/move calls"""
+        stale = [iid for iid in rendered if iid not in rows]
+        if stale:
+            tree.delete(*stale)
+        
+        for pos, iid in enumerate(order):
+            values, tag = rows[iid]
+            previous = rendered.get(iid)
+            if previous is None:
+                tree.insert('', pos, iid=iid, values=values, tags=(tag,))
+            elif previous != rows[iid]:
+                tree.item(iid, values=values, tags=(tag,))
+        
+        # Reorder only when sorting/filtering changed the sequence
+        if list(tree.get_children()) != order:
+            for pos, iid in enumerate(order):
+                tree.move(iid, '', pos)
+    
+    def refresh_recent_expenses(self):
+        """Refresh the recent expenses view in add tab with enhanced display"""
+        # Get recent expenses (last 8), as indices into self.expenses
+        recent_indices = heapq.nlargest(8, range(len(self.expenses)),
+                                        key=lambda i: self.expenses[i]['timestamp'])
+        
+        # Build rows with enhanced formatting
+        rows = {}
+        order = []
+        for i, idx in enumerate(recent_indices):
+            iid = str(idx)
+            rows[iid] = (self._row_values[idx], 'evenrow' if i % 2 == 0 else 'oddrow')
+            order.append(iid)
+        
+        # After an add this is one insert, one eviction and a re-stripe of at most 8 rows
+        self._sync_tree(self.recent_tree, self._rendered_recent, rows, order)
+        self._rendered_recent = rows
     
     def update_graph(self):
         """Update the monthly expense graph with optimized visualizations"""
-        self.fig.clear()
-
-        # Set modern style
-        plt.style.use('seaborn-v0_8-whitegrid')
+        # Charts are only drawn while visible; otherwise redraw on the next tab switch
+        if self.fig is None or not self._analytics_visible():
+            self._analytics_dirty = True
+            return
+        self._analytics_dirty = False
 
         # Get current month data
         try:
@@ -924,26 +1418,23 @@ class ExpenseTracker:
             year, month = datetime.now().year, datetime.now().month
             target_month = f"{year:04d}-{month:02d}"
 
-        # Filter expenses for the target month
-        month_expenses = [e for e in self.expenses if e['date'].startswith(target_month)]
+        # Look up the target month's expenses in the month index instead of scanning everything
+        month_amounts, month_codes, month_days = self._month_columns(f"{year:04d}-{month:02d}")
 
-        if month_expenses:
-            # Create a clean 1x2 grid layout with equal column widths
-            gs = self.fig.add_gridspec(1, 2, width_ratios=[1, 1], 
-                                       hspace=0.3, wspace=0.4,
-                                       left=0.08, right=0.95, top=0.85, bottom=0.15)
+        if len(month_amounts):
+            ax1, ax2 = self._chart_axes(True)
 
             # Monthly summary stats (left side)
-            ax1 = self.fig.add_subplot(gs[0, 0])
-            self.create_summary_stats(ax1, month_expenses, target_month)
+            ax1.cla()
+            self.create_summary_stats(ax1, month_amounts, month_codes, target_month)
 
-            # Weekly spending trend (right side)
-            ax2 = self.fig.add_subplot(gs[0, 1])
-            self.create_enhanced_weekly_trend(ax2, month_expenses)
+            # Weekly spending trend (right side); clears ax2 itself unless it can reuse the bars
+            self.create_enhanced_weekly_trend(ax2, month_days, month_amounts)
 
         else:
             # Enhanced no data display
-            ax = self.fig.add_subplot(1, 1, 1)
+            ax, = self._chart_axes(False)
+            ax.cla()
             ax.text(0.5, 0.5, f'📊 No expenses found for {target_month}\n\n💡 Add some expenses to see beautiful charts!',
                     horizontalalignment='center', verticalalignment='center',
                     transform=ax.transAxes, fontsize=18,
@@ -956,9 +1447,9 @@ class ExpenseTracker:
                           fontsize=14, fontweight='bold', y=0.93, color='#2c3e50')
 
         self.fig.patch.set_facecolor('white')
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
-    def create_enhanced_daily_chart(self, ax, month_expenses, year, month):
+    def create_enhanced_daily_chart(self, ax, days, amounts, year, month):
         """Create compact daily expense bar chart"""
         if month == 12:
             next_month = datetime(year + 1, 1, 1)
@@ -966,18 +1457,16 @@ class ExpenseTracker:
             next_month = datetime(year, month + 1, 1)
         days_in_month = (next_month - datetime(year, month, 1)).days
 
-        daily_amounts = {i: 0 for i in range(1, days_in_month + 1)}
-        for expense in month_expenses:
-            day = int(expense['date'].split('-')[2])
-            daily_amounts[day] += expense['amount']
-
-        days = list(daily_amounts.keys())
-        amounts = list(daily_amounts.values())
+        # Day-of-month offsets from the pre-parsed dates, summed per day in one bincount
+        valid = ~np.isnat(days)
+        day_offsets = (days[valid] - days[valid].astype('datetime64[M]')).astype(np.int64)
+        amounts = np.bincount(day_offsets, weights=amounts[valid], minlength=days_in_month).tolist()
+        days = list(range(1, days_in_month + 1))
         max_amount = max(amounts) if amounts else 1
 
-        # Soft blue gradient
-        custom_cmap = LinearSegmentedColormap.from_list("soft_grad", ["#74b9ff", "#0984e3", "#2d3436"])
-        colors = [custom_cmap(amount / max_amount) if amount > 0 else '#f0f0f0' for amount in amounts]
+        # Soft blue gradient, mapped for all days in one colormap call
+        shades = DAILY_CMAP(np.asarray(amounts) / (max_amount or 1))
+        colors = [shade if amount > 0 else '#f0f0f0' for shade, amount in zip(shades, amounts)]
 
         bars = ax.bar(days, amounts, color=colors, alpha=0.85, edgecolor='white', linewidth=0.4)
         sorted_amounts = sorted(enumerate(amounts), key=lambda x: x[1], reverse=True)
@@ -994,21 +1483,19 @@ class ExpenseTracker:
         ax.grid(True, alpha=0.3, linestyle='--')
         ax.set_xlim(0.5, days_in_month + 0.5)
         ax.set_xticks([1, 5, 10, 15, 20, 25, days_in_month])
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'₹{x/1000:.0f}k' if x >= 1000 else f'₹{x:.0f}'))
+        ax.yaxis.set_major_formatter(RUPEE_K_FORMATTER)
         ax.tick_params(axis='both', labelsize=8)
         for spine in ax.spines.values():
             spine.set_visible(False)
     
-    def create_enhanced_category_chart(self, ax, month_expenses):
+    def create_enhanced_category_chart(self, ax, category_codes, amounts):
         """Create compact category-wise pie chart"""
-        category_totals = {}
-        for expense in month_expenses:
-            category = expense['category']
-            category_totals[category] = category_totals.get(category, 0) + expense['amount']
+        category_totals = np.bincount(category_codes, weights=amounts)
+        present = np.flatnonzero(category_totals)
 
-        if category_totals:
-            categories = list(category_totals.keys())
-            amounts = list(category_totals.values())
+        if len(present):
+            categories = [self._category_names[code] for code in present]
+            amounts = category_totals[present].tolist()
             colors = plt.cm.Set3(np.linspace(0, 1, len(categories)))
 
             wedges, texts, autotexts = ax.pie(amounts, labels=categories, autopct='%1.0f%%',
@@ -1032,34 +1519,51 @@ class ExpenseTracker:
             ax.set_title('Category Breakdown', fontsize=11, fontweight='bold', pad=10, color='#2c3e50')
             ax.axis('off')
     
-    def create_enhanced_weekly_trend(self, ax, month_expenses):
+    def create_enhanced_weekly_trend(self, ax, days, amounts):
         """Create enhanced weekly spending trend chart"""
-        weekly_totals = {}
-        for expense in month_expenses:
-            date_obj = datetime.strptime(expense['date'], '%Y-%m-%d')
-            week_start = date_obj - timedelta(days=date_obj.weekday())
-            week_key = week_start.strftime('%Y-%m-%d')
-            weekly_totals[week_key] = weekly_totals.get(week_key, 0) + expense['amount']
+        # Dates are pre-parsed; as epoch day numbers, Monday of the week is day - (day + 3) % 7
+        valid = ~np.isnat(days)
+        epoch_days = days[valid].astype(np.int64)
+        week_starts = epoch_days - (epoch_days + 3) % 7
 
-        if weekly_totals:
-            weeks = sorted(weekly_totals.keys())
-            amounts = [weekly_totals[week] for week in weeks]
-            week_labels = [f"Week {i+1}" for i in range(len(weeks))]
+        if len(week_starts):
+            # Week number relative to the earliest week; bincount sums per week without sorting
+            week_offsets = (week_starts - week_starts.min()) // 7
+            weeks = np.flatnonzero(np.bincount(week_offsets))
+            amounts = np.bincount(week_offsets, weights=amounts[valid])[weeks].tolist()
 
             # Enhanced gradient colors for bars
             max_amount = max(amounts)
             colors = ['#3498db' if amount == max_amount else '#74b9ff' for amount in amounts]
 
+            # Same number of weeks as last time: move the existing bars and labels instead of redrawing the axes
+            if self._weekly_bars is not None and len(self._weekly_bars) == len(amounts):
+                for bar, label, amount, color in zip(self._weekly_bars, self._weekly_labels, amounts, colors):
+                    bar.set_height(amount)
+                    bar.set_facecolor(color)
+                    label.set_position((bar.get_x() + bar.get_width() / 2., amount + max_amount * 0.03))
+                    label.set_text(f'₹{amount:,.0f}')
+                    label.set_visible(amount > 0)
+                ax.set_ylim(0, max_amount * 1.15)
+                return
+
+            ax.cla()
+            ax.set_axis_on()
+            week_labels = [f"Week {i+1}" for i in range(len(weeks))]
             bars = ax.bar(week_labels, amounts, color=colors, alpha=0.85, 
-                         edgecolor='white', linewidth=1.5, width=0.7)
+                         edgecolor='white', linewidth=1.5, width=0.7, rasterized=True)
             
             # Add value labels on top of bars
+            labels = []
             for bar, amount in zip(bars, amounts):
-                if amount > 0:
-                    ax.text(bar.get_x() + bar.get_width() / 2., 
-                           bar.get_height() + max(amounts) * 0.03,
-                           f'₹{amount:,.0f}', ha='center', va='bottom', 
-                           fontsize=10, fontweight='bold', color='#2c3e50')
+                label = ax.text(bar.get_x() + bar.get_width() / 2., 
+                               bar.get_height() + max_amount * 0.03,
+                               f'₹{amount:,.0f}', ha='center', va='bottom', 
+                               fontsize=10, fontweight='bold', color='#2c3e50')
+                label.set_visible(amount > 0)
+                labels.append(label)
+            self._weekly_bars = bars
+            self._weekly_labels = labels
 
             # Enhanced styling
             ax.set_title('📈 Weekly Expense Trend', fontsize=14, fontweight='bold', 
@@ -1069,7 +1573,7 @@ class ExpenseTracker:
             ax.grid(True, alpha=0.3, linestyle='--', axis='y')
             
             # Format y-axis
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'₹{x:,.0f}'))
+            ax.yaxis.set_major_formatter(RUPEE_FORMATTER)
             ax.tick_params(axis='both', labelsize=10, colors='#2c3e50')
             
             # Remove spines for cleaner look
@@ -1080,6 +1584,8 @@ class ExpenseTracker:
             ax.set_ylim(0, max(amounts) * 1.15)
             
         else:
+            ax.cla()
+            self._weekly_bars = None
             ax.text(0.5, 0.5, '📈 No Weekly Data Available', 
                     horizontalalignment='center',
                     verticalalignment='center', 
@@ -1090,30 +1596,26 @@ class ExpenseTracker:
                         pad=20, color='#2c3e50')
             ax.axis('off')
     
-    def create_summary_stats(self, ax, month_expenses, target_month):
+    def create_summary_stats(self, ax, amounts, category_codes, target_month):
         """Create enhanced summary statistics display"""
         ax.axis('off')
 
-        if month_expenses:
-            total_amount = sum(expense['amount'] for expense in month_expenses)
+        if len(amounts):
+            total_amount = amounts.sum()
             avg_daily = total_amount / 30  # Approximate daily average
-            max_expense = max(expense['amount'] for expense in month_expenses)
-            min_expense = min(expense['amount'] for expense in month_expenses)
-            
-            # Calculate category breakdown for summary
-            category_totals = {}
-            for expense in month_expenses:
-                category = expense['category']
-                category_totals[category] = category_totals.get(category, 0) + expense['amount']
+            max_expense = amounts.max()
+            min_expense = amounts.min()
             
-            top_category = max(category_totals, key=category_totals.get) if category_totals else "N/A"
+            # Calculate category breakdown for summary (bincount with weights sums per category)
+            category_totals = np.bincount(category_codes, weights=amounts)
+            top_category = self._category_names[category_totals.argmax()]
 
             # Enhanced stats layout
             stats_text = (
                 f"📊 MONTHLY SUMMARY\n"
                 f"────────────────────\n\n"
                 f"💰 Total Spent: ₹{total_amount:,.0f}\n"
-                f"📈 Transactions: {len(month_expenses)}\n"
+                f"📈 Transactions: {len(amounts)}\n"
                 f"📅 Daily Average: ₹{avg_daily:,.0f}\n"
                 f"🔝 Highest: ₹{max_expense:,.0f}\n"
                 f"🔻 Lowest: ₹{min_expense:,.0f}\n"
@@ -1139,28 +1641,72 @@ class ExpenseTracker:
 
   
     def start_notification_service(self):
-        """Start the background notification service"""
-        def notification_worker():
+        """Start the periodic notification checks on the Tk event loop"""
+        self._notif_after_id = self.root.after_idle(self._notif_tick)
+    
+    def _notif_tick(self):
+        """Run the budget and weekly checks, then reschedule"""
+        try:
+            # Check daily budget
+            self.check_daily_budget()
+            
+            # Check for weekly spending reminders
+            self.check_weekly_reminder()
+            
+            # Forget old dated alerts so the history stays small
+            self.expire_notification_history()
+        except Exception as e:
+            print(f"Notification service error: {e}")
+        self._notif_after_id = self.root.after(NOTIFICATION_CHECK_MS, self._notif_tick)
+    
+    def expire_notification_history(self):
+        """Drop dated notification keys older than NOTIFICATION_HISTORY_DAYS"""
+        cutoff = (datetime.now() - timedelta(days=NOTIFICATION_HISTORY_DAYS)).strftime("%Y-%m-%d")
+        self.notification_history = {
+            key for key in self.notification_history
+            if (notification_key_date(key) or cutoff) >= cutoff
+        }
+    
+    def _first_notification(self, key):
+        """Record key in notification_history; True only the first time it is seen"""
+        if key in self.notification_history:
+            return False
+        self.notification_history.add(key)
+        return True
+    
+    def show_toast_notification(self, title, message, type="info", duration=3000):
+        """Show toast notification within the app (safe to call from any thread)"""
+        self._notif_q.put((title, message, type, duration))
+    
+    def _drain_toasts(self):
+        """Show the queued toasts, coalescing repeats, then poll again (runs on the Tk thread)"""
+        pending = None
+        count = 0
+        try:
             while True:
                 try:
-                    # Check daily budget every hour
-                    self.check_daily_budget()
-                    
-                    # Check for weekly spending reminders
-                    self.check_weekly_reminder()
-                    
-                    # Sleep for 1 hour
-                    time.sleep(3600)
-                except Exception as e:
-                    print(f"Notification service error: {e}")
-                    time.sleep(3600)
-        
-        # Start notification service in background thread
-        notification_thread = threading.Thread(target=notification_worker, daemon=True)
-        notification_thread.start()
+                    following = self._notif_q.get_nowait()
+                except queue.Empty:
+                    following = None
+                # Identical titles queued back to back collapse into one toast; the newest message wins
+                if pending is not None and following is not None and following[0] == pending[0]:
+                    pending = following
+                    count += 1
+                    continue
+                if pending is not None:
+                    title, message, type, duration = pending
+                    if count > 1:
+                        title = f"{title} (×{count})"
+                    self._create_toast(title, message, type, duration)
+                if following is None:
+                    break
+                pending = following
+                count = 1
+        finally:
+            self._toast_after_id = self.root.after(TOAST_POLL_MS, self._drain_toasts)
     
-    def show_toast_notification(self, title, message, type="info", duration=3000):
-        """Show toast notification within the app"""
+    def _create_toast(self, title, message, type, duration):
+        """Build and show the toast window"""
         # Create toast window
         toast = tk.Toplevel(self.root)
         toast.withdraw()  # Hide initially
@@ -1223,23 +1769,26 @@ class ExpenseTracker:
         toast.deiconify()
         
         # Auto-close toast after duration
-        def close_toast():
+        pending = {}
+        
+        def fade_step(alpha=95):
+            # Fade out animation, one step per event-loop turn
             try:
-                # Fade out animation
-                for alpha in range(100, 0, -5):
-                    toast.attributes('-alpha', alpha/100)
-                    toast.update()
-                    time.sleep(0.02)
-                toast.destroy()
-            except:
-                pass
+                if alpha <= 0:
+                    toast.destroy()
+                    return
+                toast.attributes('-alpha', alpha/100)
+                pending['id'] = toast.after(20, fade_step, alpha - 5)
+            except tk.TclError:
+                pass  # Toast was already closed
         
         # Set initial alpha and schedule closing
         toast.attributes('-alpha', 0.95)
-        self.root.after(duration, close_toast)
+        pending['id'] = toast.after(duration, fade_step)
         
         # Click to close
         def close_on_click(event=None):
+            toast.after_cancel(pending['id'])
             toast.destroy()
         
         toast.bind('<Button-1>', close_on_click)
@@ -1251,6 +1800,7 @@ class ExpenseTracker:
         """Show system tray notification"""
         if NOTIFICATIONS_AVAILABLE and self.notifications_enabled:
             try:
+                import plyer
                 plyer.notification.notify(
                     title=title,
                     message=message,
@@ -1264,17 +1814,14 @@ class ExpenseTracker:
     def check_daily_budget(self):
         """Check if daily spending exceeds budget"""
         today = datetime.now().strftime("%Y-%m-%d")
-        today_expenses = [e for e in self.expenses if e['date'] == today]
-        daily_total = sum(expense['amount'] for expense in today_expenses)
+        daily_total = self._daily_totals.get(today, 0)
         
         if daily_total > self.daily_budget:
             excess = daily_total - self.daily_budget
             
             # Check if we already notified about this today
             notification_key = f"daily_budget_{today}"
-            if notification_key not in self.notification_history:
-                self.notification_history.append(notification_key)
-                
+            if self._first_notification(notification_key):
                 # Show both toast and system notification
                 self.show_toast_notification(
                     "💸 Budget Alert!", 
@@ -1293,27 +1840,26 @@ class ExpenseTracker:
         
         # Send weekly summary every Sunday at 9 PM
         if now.weekday() == 6 and now.hour == 21:  # Sunday, 9 PM
-            week_start = now - timedelta(days=7)
-            week_expenses = [e for e in self.expenses 
-                           if datetime.strptime(e['date'], '%Y-%m-%d') >= week_start]
+            # Expense dates are whole days and the check runs at 9 PM, so "on or after now - 7 days" means after that day
+            week_start = np.datetime64((now - timedelta(days=7)).date(), 'D')
+            in_week = self._days > week_start
+            week_count = int(in_week.sum())
             
-            if week_expenses:
-                weekly_total = sum(expense['amount'] for expense in week_expenses)
+            if week_count:
+                weekly_total = self._amounts[in_week].sum()
                 
                 # Check if we already sent weekly summary today
                 notification_key = f"weekly_summary_{now.strftime('%Y-%m-%d')}"
-                if notification_key not in self.notification_history:
-                    self.notification_history.append(notification_key)
-                    
+                if self._first_notification(notification_key):
                     self.show_toast_notification(
                         "📊 Weekly Summary",
-                        f"This week's spending: ₹{weekly_total:.2f}\nTransactions: {len(week_expenses)}",
+                        f"This week's spending: ₹{weekly_total:.2f}\nTransactions: {week_count}",
                         "info"
                     )
                     
                     self.show_system_notification(
                         "📊 Weekly Expense Summary",
-                        f"You spent ₹{weekly_total:.2f} this week across {len(week_expenses)} transactions"
+                        f"You spent ₹{weekly_total:.2f} this week across {week_count} transactions"
                     )
     
     def show_achievement_notification(self, achievement_text):
@@ -1333,97 +1879,100 @@ class ExpenseTracker:
     def check_achievements(self):
         """Check for spending milestones and achievements"""
         total_expenses = len(self.expenses)
-        total_amount = sum(expense['amount'] for expense in self.expenses)
-        
-        # Achievement milestones
-        achievements = [
-            (10, "First 10 transactions recorded!"),
-            (50, "50 transactions milestone reached!"),
-            (100, "Century of transactions achieved!"),
-            (500, "500 transactions - You're a tracking pro!"),
-            (1000, "1000 transactions - Financial master!")
-        ]
-        
-        amount_achievements = [
-            (10000, "₹10,000 total expenses tracked!"),
-            (50000, "₹50,000 spending milestone!"),
-            (100000, "₹1,00,000 - Major spending milestone!"),
-            (500000, "₹5,00,000 tracked - Big spender!")
-        ]
+        total_amount = self._total_amount
+        if total_expenses > MAX_COUNT_ACHIEVEMENT and total_amount >= MAX_AMOUNT_ACHIEVEMENT + 100:
+            return
         
         # Check transaction count achievements
-        for milestone, message in achievements:
-            if total_expenses == milestone:
-                self.show_achievement_notification(message)
-                break
+        message = COUNT_ACHIEVEMENTS.get(total_expenses)
+        if message:
+            self.show_achievement_notification(message)
         
-        # Check amount achievements
-        for milestone, message in amount_achievements:
+        # Check amount achievements; only the milestones either side of the total can be within 100
+        i = bisect.bisect_left(AMOUNT_MILESTONES, total_amount)
+        for milestone in AMOUNT_MILESTONES[max(i - 1, 0):i + 1]:
             if abs(total_amount - milestone) < 100:  # Within 100 of milestone
                 achievement_key = f"amount_{milestone}"
-                if achievement_key not in self.notification_history:
-                    self.notification_history.append(achievement_key)
-                    self.show_achievement_notification(message)
+                if self._first_notification(achievement_key):
+                    self.show_achievement_notification(AMOUNT_MESSAGES[milestone])
                 break
     
+    def _center_window(self, window, width, height):
+        """Size window and center it on the screen"""
+        x = (self._screen_w - width) // 2
+        y = (self._screen_h - height) // 2
+        window.geometry(f"{width}x{height}+{x}+{y}")
+    
     def create_notification_settings_dialog(self):
-        """Create notification settings dialog"""
+        """Show the notification settings dialog, building it on first use"""
+        settings_window = self._settings_window
+        if settings_window is None:
+            settings_window = self._settings_window = self._build_notification_settings_dialog()
+        else:
+            # Reopened: show the current values, not whatever was left in the fields
+            self.notifications_var.set(self.notifications_enabled)
+            self.budget_var.set(str(self.daily_budget))
+            settings_window.deiconify()
+        settings_window.grab_set()
+    
+    def _hide_dialog(self, window):
+        """Release the grab and withdraw a reusable dialog"""
+        window.grab_release()
+        window.withdraw()
+    
+    def _build_notification_settings_dialog(self):
+        """Create the notification settings dialog; closing it only hides it"""
+        colors = self.colors
         settings_window = tk.Toplevel(self.root)
         settings_window.title("🔔 Notification Settings")
-        settings_window.geometry("400x300")
-        settings_window.configure(bg=self.colors['light'])
+        self._center_window(settings_window, 400, 300)
+        settings_window.configure(bg=colors['light'])
         settings_window.transient(self.root)
-        settings_window.grab_set()
-        
-        # Center the window
-        settings_window.update_idletasks()
-        x = (settings_window.winfo_screenwidth() // 2) - (400 // 2)
-        y = (settings_window.winfo_screenheight() // 2) - (300 // 2)
-        settings_window.geometry(f"400x300+{x}+{y}")
+        settings_window.protocol("WM_DELETE_WINDOW", lambda: self._hide_dialog(settings_window))
         
         # Header
-        header_frame = tk.Frame(settings_window, bg=self.colors['primary'], height=60)
+        header_frame = tk.Frame(settings_window, bg=colors['primary'], height=60)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
         tk.Label(header_frame, text="🔔 Notification Settings", 
                 font=('Segoe UI', 16, 'bold'),
-                fg=self.colors['white'], bg=self.colors['primary']).pack(pady=15)
+                fg=colors['white'], bg=colors['primary']).pack(pady=15)
         
         # Content frame
-        content_frame = tk.Frame(settings_window, bg=self.colors['light'])
+        content_frame = tk.Frame(settings_window, bg=colors['light'])
         content_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Enable/Disable notifications
-        notif_frame = tk.Frame(content_frame, bg=self.colors['white'], relief='solid', bd=1)
+        notif_frame = tk.Frame(content_frame, bg=colors['white'], relief='solid', bd=1)
         notif_frame.pack(fill='x', pady=(0, 15))
         
         tk.Label(notif_frame, text="General Settings", 
                 font=('Segoe UI', 12, 'bold'),
-                bg=self.colors['white'], fg=self.colors['primary']).pack(anchor='w', padx=15, pady=(10, 5))
+                bg=colors['white'], fg=colors['primary']).pack(anchor='w', padx=15, pady=(10, 5))
         
         self.notifications_var = tk.BooleanVar(value=self.notifications_enabled)
         notif_check = tk.Checkbutton(notif_frame, 
                                     text="🔔 Enable Notifications",
                                     variable=self.notifications_var,
                                     font=('Segoe UI', 11),
-                                    bg=self.colors['white'], fg=self.colors['dark'])
+                                    bg=colors['white'], fg=colors['dark'])
         notif_check.pack(anchor='w', padx=15, pady=5)
         
         # Daily budget setting
-        budget_frame = tk.Frame(content_frame, bg=self.colors['white'], relief='solid', bd=1)
+        budget_frame = tk.Frame(content_frame, bg=colors['white'], relief='solid', bd=1)
         budget_frame.pack(fill='x', pady=(0, 15))
         
         tk.Label(budget_frame, text="Budget Alerts", 
                 font=('Segoe UI', 12, 'bold'),
-                bg=self.colors['white'], fg=self.colors['primary']).pack(anchor='w', padx=15, pady=(10, 5))
+                bg=colors['white'], fg=colors['primary']).pack(anchor='w', padx=15, pady=(10, 5))
         
-        budget_row = tk.Frame(budget_frame, bg=self.colors['white'])
+        budget_row = tk.Frame(budget_frame, bg=colors['white'])
         budget_row.pack(fill='x', padx=15, pady=5)
         
         tk.Label(budget_row, text="💰 Daily Budget (₹):", 
                 font=('Segoe UI', 11),
-                bg=self.colors['white'], fg=self.colors['dark']).pack(side='left')
+                bg=colors['white'], fg=colors['dark']).pack(side='left')
         
         self.budget_var = tk.StringVar(value=str(self.daily_budget))
         budget_entry = tk.Entry(budget_row, textvariable=self.budget_var, 
@@ -1432,37 +1981,38 @@ class ExpenseTracker:
         budget_entry.pack(side='right')
         
         # Test notification button
-        test_frame = tk.Frame(content_frame, bg=self.colors['white'], relief='solid', bd=1)
+        test_frame = tk.Frame(content_frame, bg=colors['white'], relief='solid', bd=1)
         test_frame.pack(fill='x', pady=(0, 15))
         
         tk.Label(test_frame, text="Test Notifications", 
                 font=('Segoe UI', 12, 'bold'),
-                bg=self.colors['white'], fg=self.colors['primary']).pack(anchor='w', padx=15, pady=(10, 5))
+                bg=colors['white'], fg=colors['primary']).pack(anchor='w', padx=15, pady=(10, 5))
         
         test_button = tk.Button(test_frame, text="🧪 Test Notification", 
                                command=self.test_notification,
-                               bg=self.colors['info'], fg=self.colors['white'],
+                               bg=colors['info'], fg=colors['white'],
                                font=('Segoe UI', 10, 'bold'),
                                relief='flat', cursor='hand2')
         test_button.pack(anchor='w', padx=15, pady=(5, 15))
         
         # Buttons
-        button_frame = tk.Frame(content_frame, bg=self.colors['light'])
+        button_frame = tk.Frame(content_frame, bg=colors['light'])
         button_frame.pack(fill='x', pady=(10, 0))
         
         save_button = tk.Button(button_frame, text="💾 Save Settings", 
                                command=lambda: self.save_notification_settings(settings_window),
-                               bg=self.colors['success'], fg=self.colors['white'],
+                               bg=colors['success'], fg=colors['white'],
                                font=('Segoe UI', 11, 'bold'),
                                relief='flat', cursor='hand2')
         save_button.pack(side='right', padx=(5, 0), ipady=8, ipadx=15)
         
         cancel_button = tk.Button(button_frame, text="❌ Cancel", 
-                                 command=settings_window.destroy,
-                                 bg=self.colors['danger'], fg=self.colors['white'],
+                                 command=lambda: self._hide_dialog(settings_window),
+                                 bg=colors['danger'], fg=colors['white'],
                                  font=('Segoe UI', 11, 'bold'),
                                  relief='flat', cursor='hand2')
         cancel_button.pack(side='right', padx=(0, 5), ipady=8, ipadx=15)
+        return settings_window
     
     def test_notification(self):
         """Test notification system"""
@@ -1483,66 +2033,77 @@ class ExpenseTracker:
             self.notifications_enabled = self.notifications_var.get()
             self.daily_budget = float(self.budget_var.get())
             
-            # Save settings to file
-            settings = {
+            # Save settings to file; rapid saves share one write
+            self._settings_pending = {
                 "notifications_enabled": self.notifications_enabled,
                 "daily_budget": self.daily_budget
             }
+            if self._settings_after_id is None:
+                self._settings_after_id = self.root.after(SETTINGS_SAVE_DELAY_MS, self._flush_settings)
             
-            settings_file = os.path.join(os.path.dirname(__file__), "settings.json")
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
-            
-            self.show_toast_notification(
-                "✅ Settings Saved", 
-                "Notification settings have been updated successfully!", 
-                "success"
-            )
-            
-            window.destroy()
+            self._hide_dialog(window)
             
         except ValueError:
             messagebox.showerror("❌ Error", "Please enter a valid budget amount")
     
+    def _flush_settings(self):
+        """Write the latest pending settings to SETTINGS_FILE and report how it went"""
+        self._settings_after_id = None
+        try:
+            dump_json_file(SETTINGS_FILE, self._settings_pending)
+        except OSError as e:
+            self.show_toast_notification("❌ Settings Not Saved", f"Could not write settings: {e}", "error")
+            return
+        self.show_toast_notification(
+            "✅ Settings Saved", 
+            "Notification settings have been updated successfully!", 
+            "success"
+        )
+    
     def load_notification_settings(self):
         """Load notification settings from file"""
-        settings_file = os.path.join(os.path.dirname(__file__), "settings.json")
-        if os.path.exists(settings_file):
-            try:
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                self.notifications_enabled = settings.get("notifications_enabled", True)
-                self.daily_budget = settings.get("daily_budget", 1000)
-            except:
-                pass  # Use defaults if loading fails
+        try:
+            settings = load_json_file(SETTINGS_FILE)
+        except (OSError, ValueError):
+            return  # Use defaults if the file is missing or unreadable
+        if not isinstance(settings, dict):
+            return  # Valid JSON but not a settings object
+        self.notifications_enabled = settings.get("notifications_enabled", True)
+        self.daily_budget = settings.get("daily_budget", 1000)
 
     def create_ai_features_tab(self):
-        """Create the AI features tab"""
-        ai_frame = ttk.Frame(self.notebook)
-        self.notebook.add(ai_frame, text="🤖 AI Features")
+        """Add the AI features tab; its cards are built on first selection"""
+        self.ai_features_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.ai_features_frame, text="🤖 AI Features")
+        self._ai_tab_built = False
+    
+    def build_ai_features_tab(self):
+        """Create the AI features tab contents"""
+        self._ai_tab_built = True
+        colors = self.colors
+        ai_frame = self.ai_features_frame
         
-        # Main container
-        main_container = tk.Frame(ai_frame, bg=self.colors['light'])
-        main_container.pack(fill='both', expand=True, padx=30, pady=30)
+        # Main container, packed once all cards exist so the tab is laid out in one pass
+        main_container = tk.Frame(ai_frame, bg=colors['light'])
         
         # Header
-        header_frame = tk.Frame(main_container, bg=self.colors['primary'], height=80)
+        header_frame = tk.Frame(main_container, bg=colors['primary'], height=80)
         header_frame.pack(fill='x', pady=(0, 20))
         header_frame.pack_propagate(False)
         
         header_label = tk.Label(header_frame,
                                text="🤖 AI-Powered Financial Intelligence",
                                font=('Segoe UI', 20, 'bold'),
-                               fg=self.colors['white'],
-                               bg=self.colors['primary'])
+                               fg=colors['white'],
+                               bg=colors['primary'])
         header_label.pack(expand=True)
         
         # Create grid of AI feature cards
-        features_frame = tk.Frame(main_container, bg=self.colors['light'])
+        features_frame = tk.Frame(main_container, bg=colors['light'])
         features_frame.pack(fill='both', expand=True)
         
         # Row 1: Dashboard and AI Insights
-        row1_frame = tk.Frame(features_frame, bg=self.colors['light'])
+        row1_frame = tk.Frame(features_frame, bg=colors['light'])
         row1_frame.pack(fill='x', pady=(0, 20))
         
         # Real-time Dashboard Card
@@ -1552,7 +2113,7 @@ class ExpenseTracker:
             "Live analytics and interactive visualizations",
             "Open live dashboard with real-time charts, spending trends, and financial health metrics",
             self.open_dashboard,
-            self.colors['secondary']
+            colors['secondary']
         )
         dashboard_card.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
@@ -1563,12 +2124,12 @@ class ExpenseTracker:
             "Smart analysis and recommendations",
             "Get AI-powered spending analysis, pattern detection, and personalized recommendations",
             self.show_ai_insights,
-            self.colors['accent']
+            colors['accent']
         )
         insights_card.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         # Row 2: Categorization and Predictions
-        row2_frame = tk.Frame(features_frame, bg=self.colors['light'])
+        row2_frame = tk.Frame(features_frame, bg=colors['light'])
         row2_frame.pack(fill='x', pady=(0, 20))
         
         # Smart Categorization Card
@@ -1578,7 +2139,7 @@ class ExpenseTracker:
             "Automatic expense categorization",
             "AI learns from your spending habits to automatically categorize new expenses",
             self.show_categorization_settings,
-            self.colors['success']
+            colors['success']
         )
         categorization_card.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
@@ -1589,12 +2150,12 @@ class ExpenseTracker:
             "Future spending forecasts",
             "Predict future spending patterns and budget requirements using machine learning",
             self.show_predictions,
-            self.colors['warning']
+            colors['warning']
         )
         prediction_card.pack(side='left', fill='both', expand=True, padx=(10, 0))
         
         # Row 3: Anomaly Detection and Reports
-        row3_frame = tk.Frame(features_frame, bg=self.colors['light'])
+        row3_frame = tk.Frame(features_frame, bg=colors['light'])
         row3_frame.pack(fill='x')
         
         # Anomaly Detection Card
@@ -1604,7 +2165,7 @@ class ExpenseTracker:
             "Unusual spending alerts",
             "Detect unusual spending patterns and get alerts for potential budget overruns",
             self.show_anomalies,
-            self.colors['danger']
+            colors['danger']
         )
         anomaly_card.pack(side='left', fill='both', expand=True, padx=(0, 10))
         
@@ -1615,14 +2176,17 @@ class ExpenseTracker:
             "Intelligent financial reports",
             "Generate comprehensive financial reports with AI insights and recommendations",
             self.generate_smart_report,
-            self.colors['info']
+            colors['info']
         )
         reports_card.pack(side='left', fill='both', expand=True, padx=(10, 0))
+        
+        main_container.pack(fill='both', expand=True, padx=30, pady=30)
     
     def create_ai_feature_card(self, parent, title, subtitle, description, command, color):
         """Create a modern AI feature card"""
+        colors = self.colors
         # Main card frame
-        card_frame = tk.Frame(parent, bg=self.colors['white'], relief='raised', bd=2)
+        card_frame = tk.Frame(parent, bg=colors['white'], relief='raised', bd=2)
         
         # Header with color
         header_frame = tk.Frame(card_frame, bg=color, height=60)
@@ -1633,27 +2197,27 @@ class ExpenseTracker:
         title_label = tk.Label(header_frame,
                               text=title,
                               font=('Segoe UI', 14, 'bold'),
-                              fg=self.colors['white'],
+                              fg=colors['white'],
                               bg=color)
         title_label.pack(pady=(10, 0))
         
         subtitle_label = tk.Label(header_frame,
                                  text=subtitle,
                                  font=('Segoe UI', 10),
-                                 fg=self.colors['light'],
+                                 fg=colors['light'],
                                  bg=color)
         subtitle_label.pack()
         
         # Content area
-        content_frame = tk.Frame(card_frame, bg=self.colors['white'])
+        content_frame = tk.Frame(card_frame, bg=colors['white'])
         content_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Description
         desc_label = tk.Label(content_frame,
                              text=description,
                              font=('Segoe UI', 11),
-                             fg=self.colors['dark'],
-                             bg=self.colors['white'],
+                             fg=colors['dark'],
+                             bg=colors['white'],
                              wraplength=250,
                              justify='left')
         desc_label.pack(pady=(0, 15))
@@ -1663,7 +2227,7 @@ class ExpenseTracker:
                               text="Launch Feature",
                               command=command,
                               bg=color,
-                              fg=self.colors['white'],
+                              fg=colors['white'],
                               font=('Segoe UI', 11, 'bold'),
                               relief='flat',
                               cursor='hand2',
@@ -1674,8 +2238,8 @@ class ExpenseTracker:
         return card_frame
     
     def get_expense_data(self):
-        """Get expense data for AI analysis and dashboard"""
-        return self.expenses.copy()
+        """Get the live expense list for AI analysis and dashboard (callers must not modify it)"""
+        return self.expenses
     
     def open_dashboard(self):
         """Open the real-time dashboard"""
@@ -1686,6 +2250,7 @@ class ExpenseTracker:
     
     def show_ai_insights(self):
         """Show AI financial insights"""
+        colors = self.colors
         if not self.financial_ai:
             messagebox.showinfo("Info", "AI insights not available. Please install required dependencies.")
             return
@@ -1698,129 +2263,147 @@ class ExpenseTracker:
         insights_window = tk.Toplevel(self.root)
         insights_window.title("🧠 AI Financial Insights")
         insights_window.geometry("800x600")
-        insights_window.configure(bg=self.colors['light'])
+        insights_window.configure(bg=colors['light'])
         
         # Header
-        header_frame = tk.Frame(insights_window, bg=self.colors['accent'], height=60)
+        header_frame = tk.Frame(insights_window, bg=colors['accent'], height=60)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
         header_label = tk.Label(header_frame,
                                text="🧠 AI Financial Insights",
                                font=('Segoe UI', 18, 'bold'),
-                               fg=self.colors['white'],
-                               bg=self.colors['accent'])
+                               fg=colors['white'],
+                               bg=colors['accent'])
         header_label.pack(expand=True)
         
         # Loading label
         loading_label = tk.Label(insights_window,
                                 text="🔄 Analyzing your financial data...",
                                 font=('Segoe UI', 14),
-                                fg=self.colors['dark'],
-                                bg=self.colors['light'])
+                                fg=colors['dark'],
+                                bg=colors['light'])
         loading_label.pack(expand=True)
         
-        # Generate insights in background
-        def generate_insights():
-            try:
-                insights = self.financial_ai.analyze_spending_patterns(self.expenses)
-                
-                # Update UI with insights
-                insights_window.after(0, lambda: self.display_insights(insights_window, insights, loading_label))
-            except Exception as e:
-                insights_window.after(0, lambda: loading_label.config(text=f"Error generating insights: {str(e)}"))
-        
-        # Start analysis in background thread
-        threading.Thread(target=generate_insights, daemon=True).start()
+        self._request_insights(self._show_insights_result, insights_window, loading_label)
+    
+    def _request_insights(self, callback, *args):
+        """Call callback(future, *args) on the Tk thread once the shared insights analysis is done"""
+        # Analyze a snapshot on the AI worker; every caller reuses the same analysis until an expense changes
+        if self._insights_future is None:
+            self._insights_future = self._ai_executor.submit(
+                self.financial_ai.analyze_spending_patterns, list(self.expenses))
+        self._after_future(self._insights_future, callback, *args)
+    
+    def _insights_result(self, future):
+        """Return a finished analysis' insights, dropping a failed one so the next request retries"""
+        try:
+            return future.result()
+        except Exception:
+            if future is self._insights_future:
+                self._insights_future = None
+            raise
+    
+    def _show_insights_result(self, future, window, loading_label):
+        """Display a finished insights analysis, unless its window was closed meanwhile"""
+        if not window.winfo_exists():
+            return
+        try:
+            insights = self._insights_result(future)
+        except Exception as e:
+            loading_label.config(text=f"Error generating insights: {str(e)}")
+            return
+        self.display_insights(window, insights, loading_label)
     
     def display_insights(self, window, insights, loading_label):
         """Display the AI insights in the window"""
+        colors = self.colors
         # Remove loading label
         loading_label.destroy()
         
         # Create scrollable text area
-        text_frame = tk.Frame(window, bg=self.colors['light'])
+        text_frame = tk.Frame(window, bg=colors['light'])
         text_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Text widget with scrollbar
         text_widget = tk.Text(text_frame,
                              wrap=tk.WORD,
                              font=('Segoe UI', 11),
-                             bg=self.colors['white'],
-                             fg=self.colors['dark'],
+                             bg=colors['white'],
+                             fg=colors['dark'],
                              padx=20,
                              pady=20)
         scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=text_widget.yview)
         text_widget.configure(yscrollcommand=scrollbar.set)
         
-        text_widget.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Format and display insights
+        # Fill the widget in one insert before it is mapped, so Tk lays the report out once
         formatted_text = self.format_insights_text(insights)
         text_widget.insert(tk.END, formatted_text)
         text_widget.config(state=tk.DISABLED)
+        
+        text_widget.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
     
     def format_insights_text(self, insights):
         """Format insights for display"""
         if insights.get('status') != 'success':
             return f"Unable to generate insights: {insights.get('message', 'Unknown error')}"
         
-        text = "🧠 AI FINANCIAL INSIGHTS REPORT\n"
-        text += "=" * 50 + "\n\n"
+        parts = ["🧠 AI FINANCIAL INSIGHTS REPORT\n", REPORT_RULE, "\n\n"]
         
         # Analysis period
         if 'data_period' in insights:
             period = insights['data_period']
-            text += f"📊 Analysis Period: {period.get('start_date')} to {period.get('end_date')}\n"
-            text += f"📈 Total Transactions: {period.get('total_transactions', 0)}\n\n"
+            parts.append(f"📊 Analysis Period: {period.get('start_date')} to {period.get('end_date')}\n")
+            parts.append(f"📈 Total Transactions: {period.get('total_transactions', 0)}\n\n")
         
         # Spending summary
         if 'spending_summary' in insights:
             summary = insights['spending_summary']
-            text += "💰 SPENDING SUMMARY\n"
-            text += f"• Total Spending: ₹{summary.get('total_spending', 0):,.2f}\n"
-            text += f"• Daily Average: ₹{summary.get('average_daily', 0):,.2f}\n"
-            text += f"• Average Transaction: ₹{summary.get('average_transaction', 0):,.2f}\n"
-            text += f"• Largest Transaction: ₹{summary.get('largest_transaction', 0):,.2f}\n\n"
+            parts.append("💰 SPENDING SUMMARY\n")
+            parts.append(f"• Total Spending: ₹{summary.get('total_spending', 0):,.2f}\n")
+            parts.append(f"• Daily Average: ₹{summary.get('average_daily', 0):,.2f}\n")
+            parts.append(f"• Average Transaction: ₹{summary.get('average_transaction', 0):,.2f}\n")
+            parts.append(f"• Largest Transaction: ₹{summary.get('largest_transaction', 0):,.2f}\n\n")
         
         # Financial health
         if 'financial_health' in insights:
             health = insights['financial_health']
             score = health.get('overall_score', 0)
             status = health.get('status', 'unknown')
-            text += f"🏥 FINANCIAL HEALTH SCORE: {score:.0f}/100 ({status.upper()})\n\n"
+            parts.append(f"🏥 FINANCIAL HEALTH SCORE: {score:.0f}/100 ({status.upper()})\n\n")
         
         # Recommendations
         if 'recommendations' in insights and insights['recommendations']:
-            text += "💡 AI RECOMMENDATIONS\n"
+            parts.append("💡 AI RECOMMENDATIONS\n")
             for i, rec in enumerate(insights['recommendations'], 1):
                 priority = rec.get('priority', 'medium').upper()
-                text += f"{i}. [{priority}] {rec.get('title', 'Recommendation')}\n"
-                text += f"   {rec.get('message', 'No details available')}\n"
+                parts.append(f"{i}. [{priority}] {rec.get('title', 'Recommendation')}\n")
+                parts.append(f"   {rec.get('message', 'No details available')}\n")
                 if 'action' in rec:
-                    text += f"   Action: {rec['action']}\n"
-                text += "\n"
+                    parts.append(f"   Action: {rec['action']}\n")
+                parts.append("\n")
         
         # Anomalies
         if 'anomalies' in insights and insights['anomalies'].get('status') != 'insufficient_data':
             anomalies = insights['anomalies']
-            text += "⚠️ SPENDING ANOMALIES\n"
+            parts.append("⚠️ SPENDING ANOMALIES\n")
             if 'transaction_outliers' in anomalies:
                 outliers = anomalies['transaction_outliers']
-                text += f"• High-value transactions: {outliers.get('high_value_transactions', 0)}\n"
+                parts.append(f"• High-value transactions: {outliers.get('high_value_transactions', 0)}\n")
                 if 'largest_transaction' in outliers:
                     largest = outliers['largest_transaction']
-                    text += f"• Largest: ₹{largest.get('amount', 0):,.2f} on {largest.get('date', 'unknown')}\n"
-            text += "\n"
+                    parts.append(f"• Largest: ₹{largest.get('amount', 0):,.2f} on {largest.get('date', 'unknown')}\n")
+            parts.append("\n")
         
-        text += "Generated by AI Financial Intelligence Engine\n"
-        text += f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        parts.append("Generated by AI Financial Intelligence Engine\n")
+        parts.append(f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
-        return text
+        return "".join(parts)
     
     def show_categorization_settings(self):
         """Show AI categorization settings and statistics"""
+        colors = self.colors
         if not self.ai_categorizer:
             messagebox.showinfo("Info", "AI categorization not available.")
             return
@@ -1829,22 +2412,22 @@ class ExpenseTracker:
         settings_window = tk.Toplevel(self.root)
         settings_window.title("🏷️ Smart Categorization Settings")
         settings_window.geometry("600x500")
-        settings_window.configure(bg=self.colors['light'])
+        settings_window.configure(bg=colors['light'])
         
         # Header
-        header_frame = tk.Frame(settings_window, bg=self.colors['success'], height=60)
+        header_frame = tk.Frame(settings_window, bg=colors['success'], height=60)
         header_frame.pack(fill='x')
         header_frame.pack_propagate(False)
         
         header_label = tk.Label(header_frame,
                                text="🏷️ Smart Categorization Settings",
                                font=('Segoe UI', 16, 'bold'),
-                               fg=self.colors['white'],
-                               bg=self.colors['success'])
+                               fg=colors['white'],
+                               bg=colors['success'])
         header_label.pack(expand=True)
         
         # Content frame
-        content_frame = tk.Frame(settings_window, bg=self.colors['light'])
+        content_frame = tk.Frame(settings_window, bg=colors['light'])
         content_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
         # Statistics
@@ -1852,45 +2435,23 @@ class ExpenseTracker:
                             height=15,
                             wrap=tk.WORD,
                             font=('Segoe UI', 11),
-                            bg=self.colors['white'],
+                            bg=colors['white'],
                             padx=15,
                             pady=15)
         stats_text.pack(fill='both', expand=True)
         
-        # Generate statistics
-        stats_info = "🏷️ SMART CATEGORIZATION STATUS\n"
-        stats_info += "=" * 40 + "\n\n"
-        stats_info += "✅ AI Categorization: ACTIVE\n"
-        stats_info += "📊 Learning Mode: Enabled\n"
-        stats_info += "🎯 Accuracy: Improving with each transaction\n\n"
-        stats_info += "FEATURES:\n"
-        stats_info += "• Machine Learning categorization\n"
-        stats_info += "• Keyword-based fallback system\n"
-        stats_info += "• User feedback learning\n"
-        stats_info += "• Continuous improvement\n\n"
-        stats_info += "HOW IT WORKS:\n"
-        stats_info += "1. AI analyzes expense description and amount\n"
-        stats_info += "2. Suggests most likely category\n"
-        stats_info += "3. Learns from your feedback\n"
-        stats_info += "4. Improves accuracy over time\n\n"
-        stats_info += "CATEGORIES AVAILABLE:\n"
-        categories = ["Food", "Transportation", "Entertainment", "Shopping", 
-                     "Bills", "Healthcare", "Education", "Other"]
-        for cat in categories:
-            stats_info += f"• {cat}\n"
-        
-        stats_text.insert(tk.END, stats_info)
+        stats_text.insert(tk.END, CATEGORIZATION_STATUS_TEXT)
         stats_text.config(state=tk.DISABLED)
         
         # Control buttons
-        button_frame = tk.Frame(content_frame, bg=self.colors['light'])
+        button_frame = tk.Frame(content_frame, bg=colors['light'])
         button_frame.pack(fill='x', pady=(10, 0))
         
         retrain_btn = tk.Button(button_frame,
                                text="🔄 Retrain AI Model",
                                command=self.retrain_ai_model,
-                               bg=self.colors['success'],
-                               fg=self.colors['white'],
+                               bg=colors['success'],
+                               fg=colors['white'],
                                font=('Segoe UI', 11, 'bold'),
                                relief='flat',
                                padx=20,
@@ -1900,8 +2461,8 @@ class ExpenseTracker:
         test_btn = tk.Button(button_frame,
                             text="🧪 Test Categorization",
                             command=self.test_categorization,
-                            bg=self.colors['info'],
-                            fg=self.colors['white'],
+                            bg=colors['info'],
+                            fg=colors['white'],
                             font=('Segoe UI', 11, 'bold'),
                             relief='flat',
                             padx=20,
@@ -1927,7 +2488,9 @@ class ExpenseTracker:
         
         try:
             # Train on existing data
-            training_data = [(exp['description'], exp['amount'], exp['category']) for exp in self.expenses]
+            if self._training_rows is None:
+                self._training_rows = [(exp['description'], exp['amount'], exp['category']) for exp in self.expenses]
+            training_data = self._training_rows
             
             if training_data:
                 self.ai_categorizer.train_model(training_data)
@@ -1939,6 +2502,7 @@ class ExpenseTracker:
     
     def test_categorization(self):
         """Test the AI categorization with user input"""
+        colors = self.colors
         if not self.ai_categorizer:
             return
         
@@ -1946,12 +2510,12 @@ class ExpenseTracker:
         test_window = tk.Toplevel(self.root)
         test_window.title("🧪 Test AI Categorization")
         test_window.geometry("500x300")
-        test_window.configure(bg=self.colors['light'])
+        test_window.configure(bg=colors['light'])
         
         # Input fields
         tk.Label(test_window, text="Test Description:", 
                 font=('Segoe UI', 12, 'bold'),
-                bg=self.colors['light']).pack(pady=10)
+                bg=colors['light']).pack(pady=10)
         
         desc_entry = tk.Entry(test_window, font=('Segoe UI', 12), width=40)
         desc_entry.pack(pady=5)
@@ -1959,7 +2523,7 @@ class ExpenseTracker:
         
         tk.Label(test_window, text="Test Amount:", 
                 font=('Segoe UI', 12, 'bold'),
-                bg=self.colors['light']).pack(pady=(20, 10))
+                bg=colors['light']).pack(pady=(20, 10))
         
         amount_entry = tk.Entry(test_window, font=('Segoe UI', 12), width=20)
         amount_entry.pack(pady=5)
@@ -1968,7 +2532,7 @@ class ExpenseTracker:
         # Result area
         result_label = tk.Label(test_window, text="", 
                                font=('Segoe UI', 12),
-                               bg=self.colors['light'],
+                               bg=colors['light'],
                                wraplength=450)
         result_label.pack(pady=20)
         
@@ -1982,15 +2546,15 @@ class ExpenseTracker:
                 result_text = f"🤖 AI Prediction: {predicted_category}\n\n"
                 result_text += f"Input: '{description}' - ₹{amount}"
                 
-                result_label.config(text=result_text, fg=self.colors['success'])
+                result_label.config(text=result_text, fg=colors['success'])
             except Exception as e:
-                result_label.config(text=f"Error: {str(e)}", fg=self.colors['danger'])
+                result_label.config(text=f"Error: {str(e)}", fg=colors['danger'])
         
         test_btn = tk.Button(test_window,
                             text="🧪 Test Categorization",
                             command=run_test,
-                            bg=self.colors['info'],
-                            fg=self.colors['white'],
+                            bg=colors['info'],
+                            fg=colors['white'],
                             font=('Segoe UI', 12, 'bold'),
                             relief='flat',
                             padx=20,
@@ -1999,23 +2563,24 @@ class ExpenseTracker:
     
     def create_ai_suggestions_panel(self):
         """Create a prominent AI suggestions panel in the main interface"""
+        colors = self.colors
         # Create collapsible AI suggestions frame
-        self.ai_panel = tk.Frame(self.main_frame, bg=self.colors['primary'], relief='raised', bd=2)
+        self.ai_panel = tk.Frame(self.main_frame, bg=colors['primary'], relief='raised', bd=2)
         self.ai_panel.pack(fill='x', padx=10, pady=(10, 5))
         
         # Header with toggle button
-        header_frame = tk.Frame(self.ai_panel, bg=self.colors['primary'])
+        header_frame = tk.Frame(self.ai_panel, bg=colors['primary'])
         header_frame.pack(fill='x', padx=10, pady=5)
         
         # AI icon and title
-        title_frame = tk.Frame(header_frame, bg=self.colors['primary'])
+        title_frame = tk.Frame(header_frame, bg=colors['primary'])
         title_frame.pack(side='left', fill='x', expand=True)
         
         self.ai_title = tk.Label(title_frame, 
                                 text="🤖 AI Financial Assistant",
                                 font=('Segoe UI', 12, 'bold'),
-                                fg=self.colors['white'],
-                                bg=self.colors['primary'])
+                                fg=colors['white'],
+                                bg=colors['primary'])
         self.ai_title.pack(side='left')
         
         # Live indicator
@@ -2023,7 +2588,7 @@ class ExpenseTracker:
                                  text="🟢 LIVE",
                                  font=('Segoe UI', 9, 'bold'),
                                  fg='#00ff00',
-                                 bg=self.colors['primary'])
+                                 bg=colors['primary'])
         self.ai_status.pack(side='left', padx=(10, 0))
         
         # Toggle button
@@ -2031,29 +2596,43 @@ class ExpenseTracker:
         self.toggle_btn = tk.Button(header_frame,
                                    text="▼",
                                    command=self.toggle_ai_panel,
-                                   bg=self.colors['secondary'],
-                                   fg=self.colors['white'],
+                                   bg=colors['secondary'],
+                                   fg=colors['white'],
                                    font=('Segoe UI', 10, 'bold'),
                                    width=3,
                                    relief='flat')
         self.toggle_btn.pack(side='right')
         
         # Content frame (collapsible)
-        self.ai_content = tk.Frame(self.ai_panel, bg=self.colors['white'])
+        self.ai_content = tk.Frame(self.ai_panel, bg=colors['white'])
         self.ai_content.pack(fill='x', padx=10, pady=(0, 10))
         
         # Create suggestion cards container
-        self.suggestions_container = tk.Frame(self.ai_content, bg=self.colors['white'])
+        self.suggestions_container = tk.Frame(self.ai_content, bg=colors['white'])
         self.suggestions_container.pack(fill='x', pady=10)
+        # Loading / empty / error line, shown in place of the cards
+        self._suggestion_status = tk.Label(self.suggestions_container,
+                                           font=('Segoe UI', 10),
+                                           bg=colors['white'])
+        # Suggestion card widgets, built as needed and reused on every refresh
+        self._suggestion_cards = []
+        # Suggestions currently shown; card i's action button reads entry i
+        self._current_suggestions = []
+        # Insights future the shown suggestions came from
+        self._rendered_insights = None
         
         # Quick stats row
-        self.quick_stats_frame = tk.Frame(self.ai_content, bg=self.colors['white'])
+        self.quick_stats_frame = tk.Frame(self.ai_content, bg=colors['white'])
         self.quick_stats_frame.pack(fill='x', pady=(0, 10))
+        # Value labels of the quick stat cards, keyed by card label (built on first display)
+        self.quick_stat_values = {}
+        self._last_quick_stats = None
         
         # Initialize with loading state
         self.update_ai_suggestions()
         
-        # Auto-refresh suggestions every 30 seconds
+        # Auto-refresh suggestions every AI_REFRESH_MS
+        self._ai_after_id = None
         self.schedule_ai_updates()
     
     def toggle_ai_panel(self):
@@ -2066,68 +2645,62 @@ class ExpenseTracker:
             self.ai_content.pack(fill='x', padx=10, pady=(0, 10))
             self.toggle_btn.config(text="▼")
             self.ai_expanded.set(True)
+            # Refreshes were skipped while collapsed
+            self.update_ai_suggestions()
+            self.schedule_ai_updates()
     
     def update_ai_suggestions(self):
         """Update the AI suggestions panel with live recommendations"""
         if not AI_FEATURES_AVAILABLE or not hasattr(self, 'suggestions_container'):
             return
-        
-        # Clear existing suggestions
-        for widget in self.suggestions_container.winfo_children():
-            widget.destroy()
-        
-        for widget in self.quick_stats_frame.winfo_children():
-            widget.destroy()
+        # Nothing changed since the shown suggestions were built, so keep them as they are
+        if self.expenses and self._insights_future is not None and self._insights_future is self._rendered_insights:
+            return
         
         try:
             # Show loading state
-            loading_label = tk.Label(self.suggestions_container,
-                                   text="🔄 Analyzing your spending...",
-                                   font=('Segoe UI', 10),
-                                   fg=self.colors['info'],
-                                   bg=self.colors['white'])
-            loading_label.pack(pady=10)
+            self._show_suggestion_status("🔄 Analyzing your spending...", self.colors['info'])
             
-            # Generate suggestions in background
-            def generate_live_suggestions():
-                try:
-                    if not self.expenses:
-                        suggestions = self.get_welcome_suggestions()
-                    else:
-                        # Get AI insights
-                        insights = self.financial_ai.analyze_spending_patterns(self.expenses)
-                        suggestions = self.extract_actionable_suggestions(insights)
-                    
-                    # Update UI on main thread
-                    self.root.after(0, lambda: self.display_live_suggestions(suggestions))
-                except Exception as e:
-                    self.root.after(0, lambda: self.display_suggestion_error(str(e)))
-            
-            # Start analysis in background
-            threading.Thread(target=generate_live_suggestions, daemon=True).start()
+            if not self.expenses:
+                self.display_live_suggestions(self.get_welcome_suggestions())
+            else:
+                # Get AI insights from the shared analysis
+                self._request_insights(self._show_live_suggestions)
             
         except Exception as e:
             self.display_suggestion_error(str(e))
     
+    def _show_live_suggestions(self, future):
+        """Turn a finished insights analysis into suggestion cards"""
+        if not self.suggestions_container.winfo_exists():
+            return
+        try:
+            suggestions = self.extract_actionable_suggestions(self._insights_result(future))
+        except Exception as e:
+            self.display_suggestion_error(str(e))
+            return
+        self.display_live_suggestions(suggestions)
+        self._rendered_insights = future
+    
     def get_welcome_suggestions(self):
         """Get welcome suggestions for new users"""
         return [
-            {
-                'type': 'welcome',
-                'title': '👋 Welcome to AI-Powered Expense Tracking!',
-                'message': 'Start by adding a few expenses to unlock personalized insights.',
-                'action': 'Add your first expense',
-                'priority': 'info',
-                'icon': '🚀'
-            },
-            {
-                'type': 'tip',
-                'title': '💡 Smart Categorization Ready',
-                'message': 'AI will automatically suggest categories for your expenses.',
-                'action': 'Learn more',
-                'priority': 'info',
-                'icon': '🏷️'
-            }
+            Suggestion(
+                type='welcome',
+                title='👋 Welcome to AI-Powered Expense Tracking!',
+                message='Start by adding a few expenses to unlock personalized insights.',
+                action='Add your first expense',
+                priority='info',
+                icon='🚀'
+            ),
+            Suggestion(
+                type='tip',
+                title='💡 Smart Categorization Ready',
+                message='AI will automatically suggest categories for your expenses.',
+                action='Learn more',
+                priority='info',
+                icon='🏷️'
+            )
         ]
     
     def extract_actionable_suggestions(self, insights):
@@ -2135,13 +2708,13 @@ class ExpenseTracker:
         suggestions = []
         
         if insights.get('status') != 'success':
-            return [{
-                'type': 'error',
-                'title': '⚠️ Analysis Unavailable',
-                'message': 'Unable to generate insights. Please check your data.',
-                'priority': 'warning',
-                'icon': '⚠️'
-            }]
+            return [Suggestion(
+                type='error',
+                title='⚠️ Analysis Unavailable',
+                message='Unable to generate insights. Please check your data.',
+                priority='warning',
+                icon='⚠️'
+            )]
         
         # Add financial health score as first suggestion
         if 'financial_health' in insights:
@@ -2162,30 +2735,28 @@ class ExpenseTracker:
                 priority = 'danger'
                 title = f'Financial Health Needs Attention ({score:.0f}/100)'
             
-            suggestions.append({
-                'type': 'health',
-                'title': title,
-                'message': f'Your spending pattern is {status}. Click to see improvement tips.',
-                'action': 'View Details',
-                'priority': priority,
-                'icon': icon
-            })
+            suggestions.append(Suggestion(
+                type='health',
+                title=title,
+                message=f'Your spending pattern is {status}. Click to see improvement tips.',
+                action='View Details',
+                priority=priority,
+                icon=icon
+            ))
         
         # Add top recommendations
         if 'recommendations' in insights and insights['recommendations']:
             for rec in insights['recommendations'][:2]:  # Show top 2 recommendations
-                priority_map = {'high': 'danger', 'medium': 'warning', 'low': 'info'}
-                icon_map = {'high': '🚨', 'medium': '💡', 'low': 'ℹ️'}
-                
                 rec_priority = rec.get('priority', 'medium').lower()
-                suggestions.append({
-                    'type': 'recommendation',
-                    'title': rec.get('title', 'AI Recommendation'),
-                    'message': rec.get('message', 'No details available'),
-                    'action': rec.get('action', 'Learn More'),
-                    'priority': priority_map.get(rec_priority, 'info'),
-                    'icon': icon_map.get(rec_priority, '💡')
-                })
+                priority, icon = RECOMMENDATION_STYLE.get(rec_priority, ('info', '💡'))
+                suggestions.append(Suggestion(
+                    type='recommendation',
+                    title=rec.get('title', 'AI Recommendation'),
+                    message=rec.get('message', 'No details available'),
+                    action=rec.get('action', 'Learn More'),
+                    priority=priority,
+                    icon=icon
+                ))
         
         # Add spending anomaly alert
         if 'anomalies' in insights and insights['anomalies'].get('status') != 'insufficient_data':
@@ -2194,14 +2765,14 @@ class ExpenseTracker:
                 outliers = anomalies['transaction_outliers']
                 high_value = outliers.get('high_value_transactions', 0)
                 if high_value > 0:
-                    suggestions.append({
-                        'type': 'anomaly',
-                        'title': f'🔍 {high_value} Unusual Transaction(s) Detected',
-                        'message': 'Some expenses seem higher than usual. Review them for accuracy.',
-                        'action': 'Review Transactions',
-                        'priority': 'warning',
-                        'icon': '⚠️'
-                    })
+                    suggestions.append(Suggestion(
+                        type='anomaly',
+                        title=f'🔍 {high_value} Unusual Transaction(s) Detected',
+                        message='Some expenses seem higher than usual. Review them for accuracy.',
+                        action='Review Transactions',
+                        priority='warning',
+                        icon='⚠️'
+                    ))
         
         # Add spending trend alert
         if 'spending_trends' in insights:
@@ -2209,110 +2780,111 @@ class ExpenseTracker:
             if 'daily_trend' in trends:
                 trend = trends['daily_trend'].get('trend_direction', 'stable')
                 if trend == 'increasing':
-                    suggestions.append({
-                        'type': 'trend',
-                        'title': '📈 Spending Trend: Increasing',
-                        'message': 'Your daily spending has been increasing. Consider reviewing your budget.',
-                        'action': 'View Trends',
-                        'priority': 'warning',
-                        'icon': '📈'
-                    })
+                    suggestions.append(Suggestion(
+                        type='trend',
+                        title='📈 Spending Trend: Increasing',
+                        message='Your daily spending has been increasing. Consider reviewing your budget.',
+                        action='View Trends',
+                        priority='warning',
+                        icon='📈'
+                    ))
         
         return suggestions
     
+    def _show_suggestion_status(self, text, color):
+        """Hide the suggestion cards and show a single status line in their place"""
+        for card in self._suggestion_cards:
+            card['frame'].pack_forget()
+        self._suggestion_status.config(text=text, fg=color)
+        self._suggestion_status.pack(pady=10)
+    
     def display_live_suggestions(self, suggestions):
         """Display the live suggestions in the panel"""
-        # Clear loading state
-        for widget in self.suggestions_container.winfo_children():
-            widget.destroy()
-        
+        # Set even when empty: the urgent alert check reuses these for the rendered analysis
+        self._current_suggestions = suggestions
         if not suggestions:
-            no_suggestions = tk.Label(self.suggestions_container,
-                                     text="✅ All good! No urgent suggestions at the moment.",
-                                     font=('Segoe UI', 10),
-                                     fg=self.colors['success'],
-                                     bg=self.colors['white'])
-            no_suggestions.pack(pady=10)
+            self._show_suggestion_status("✅ All good! No urgent suggestions at the moment.",
+                                         self.colors['success'])
             return
         
-        # Display each suggestion as a card
+        # Clear loading state
+        self._suggestion_status.pack_forget()
+        
+        # Display each suggestion as a card, reusing the cards from the last refresh
+        cards = self._suggestion_cards
         for i, suggestion in enumerate(suggestions):
-            self.create_suggestion_card(self.suggestions_container, suggestion, i)
+            if i == len(cards):
+                cards.append(self.create_suggestion_card(self.suggestions_container, i))
+            self.fill_suggestion_card(cards[i], suggestion)
+        for card in cards[len(suggestions):]:
+            card['frame'].pack_forget()
         
         # Add quick stats
         self.display_quick_stats()
     
-    def create_suggestion_card(self, parent, suggestion, index):
-        """Create a suggestion card widget"""
-        # Color mapping for priorities
-        color_map = {
-            'danger': '#e74c3c',
-            'warning': '#f39c12',
-            'success': '#27ae60',
-            'info': '#3498db'
-        }
-        
-        bg_color_map = {
-            'danger': '#fdf2f2',
-            'warning': '#fef9e7',
-            'success': '#f0f9f4',
-            'info': '#eff8ff'
-        }
-        
-        priority = suggestion.get('priority', 'info')
-        accent_color = color_map.get(priority, '#3498db')
-        bg_color = bg_color_map.get(priority, '#eff8ff')
-        
+    def create_suggestion_card(self, parent, index):
+        """Create an empty card for slot index; fill_suggestion_card sets its content"""
         # Card frame
-        card_frame = tk.Frame(parent, bg=bg_color, relief='solid', bd=1)
-        card_frame.pack(fill='x', padx=5, pady=2)
+        card_frame = ttk.Frame(parent)
         
         # Left accent bar
-        accent_bar = tk.Frame(card_frame, bg=accent_color, width=4)
+        accent_bar = ttk.Frame(card_frame, width=4)
         accent_bar.pack(side='left', fill='y')
         
         # Content frame
-        content_frame = tk.Frame(card_frame, bg=bg_color)
+        content_frame = ttk.Frame(card_frame)
         content_frame.pack(side='left', fill='both', expand=True, padx=10, pady=8)
         
         # Title with icon
-        title_frame = tk.Frame(content_frame, bg=bg_color)
+        title_frame = ttk.Frame(content_frame)
         title_frame.pack(fill='x')
         
-        title_label = tk.Label(title_frame,
-                              text=f"{suggestion.get('icon', '💡')} {suggestion.get('title', 'Suggestion')}",
-                              font=('Segoe UI', 10, 'bold'),
-                              fg=accent_color,
-                              bg=bg_color,
-                              anchor='w')
+        title_label = ttk.Label(title_frame, anchor='w')
         title_label.pack(side='left', fill='x', expand=True)
         
         # Message
-        message_label = tk.Label(content_frame,
-                                text=suggestion.get('message', ''),
-                                font=('Segoe UI', 9),
-                                fg=self.colors['dark'],
-                                bg=bg_color,
-                                anchor='w',
-                                wraplength=400)
+        message_label = ttk.Label(content_frame, anchor='w', justify='left')
         message_label.pack(fill='x', pady=(2, 0))
         
+        # Action button, packed only for suggestions that have an action
+        action_btn = ttk.Button(content_frame, command=partial(self._on_card_action, index))
+        
+        return {'frame': card_frame, 'accent_bar': accent_bar, 'content': content_frame,
+                'title_frame': title_frame, 'title': title_label, 'message': message_label,
+                'action': action_btn}
+    
+    def fill_suggestion_card(self, card, suggestion):
+        """Show suggestion on a pooled card by switching its widgets to the priority's styles"""
+        priority = suggestion.priority
+        name = priority.title() if priority in SUGGESTION_PALETTE else 'Info'
+        
+        card['frame'].config(style=f'{name}.SuggestionCard.TFrame')
+        card['content'].config(style=f'{name}.Suggestion.TFrame')
+        card['title_frame'].config(style=f'{name}.Suggestion.TFrame')
+        card['accent_bar'].config(style=f'{name}.SuggestionAccent.TFrame')
+        card['title'].config(text=f"{suggestion.icon} {suggestion.title}",
+                             style=f'{name}.SuggestionTitle.TLabel')
+        card['message'].config(text=textwrap.fill(suggestion.message, SUGGESTION_WRAP_CHARS),
+                               style=f'{name}.SuggestionMessage.TLabel')
+        
         # Action button (if applicable)
-        action = suggestion.get('action')
+        action = suggestion.action
+        action_btn = card['action']
         if action and action not in ['Learn More', 'Learn more']:
-            action_btn = tk.Button(content_frame,
-                                  text=f"→ {action}",
-                                  command=lambda: self.handle_suggestion_action(suggestion),
-                                  bg=accent_color,
-                                  fg='white',
-                                  font=('Segoe UI', 8, 'bold'),
-                                  relief='flat',
-                                  padx=10)
+            action_btn.config(text=f"→ {action}", style=f'{name}.Suggestion.TButton')
             action_btn.pack(anchor='w', pady=(5, 0))
+        else:
+            action_btn.pack_forget()
+        
+        card['frame'].pack(fill='x', padx=5, pady=2)
+    
+    def _on_card_action(self, index):
+        """Run the action of the suggestion shown on card index"""
+        self.handle_suggestion_action(self._current_suggestions[index])
     
     def handle_suggestion_action(self, suggestion):
         """Handle suggestion action clicks"""
-        suggestion_type = suggestion.get('type', '')
+        suggestion_type = suggestion.type
         
         if suggestion_type == 'health':
             self.show_ai_insights()
@@ -2333,27 +2905,22 @@ class ExpenseTracker:
             return
         
         # Calculate average transaction amount
-        amounts = [float(expense['amount']) for expense in self.expenses]
-        avg_amount = statistics.mean(amounts)
+        avg_amount = float(self._amounts.mean())
         threshold = avg_amount * 2  # Transactions 2x above average
-        
-        # Filter tree view to show only high-value transactions
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        high_value_count = 0
-        for expense in self.expenses:
-            if float(expense['amount']) > threshold:
-                amount_color = 'red' if float(expense['amount']) > threshold * 1.5 else 'orange'
-                item = self.tree.insert('', 'end', values=(
-                    expense['date'],
-                    expense['category'],
-                    expense['description'],
-                    f"₹{float(expense['amount']):.2f}"
-                ))
-                # Highlight high-value transactions
-                self.tree.set(item, 'amount', f"⚠️ ₹{float(expense['amount']):.2f}")
-                high_value_count += 1
+        high_value = np.flatnonzero(self._amounts > threshold)
+        
+        # Filter the transactions view to only high-value transactions, amounts flagged with ⚠️
+        rows = {}
+        order = []
+        for i, idx in enumerate(high_value):
+            iid = str(idx)
+            date, _amount, category, description = self._row_values[idx]
+            rows[iid] = ((date, f"⚠️ ₹{self._amounts[idx]:.2f}", category, description),
+                         'evenrow' if i % 2 == 0 else 'oddrow')
+            order.append(iid)
+        self._sync_tree(self.transactions_tree, self._rendered_rows, rows, order)
+        self._rendered_rows = rows
+        high_value_count = len(high_value)
         
         # Show message about filtering
         messagebox.showinfo("High-Value Transactions", 
@@ -2362,22 +2929,19 @@ class ExpenseTracker:
     
     def display_quick_stats(self):
         """Display quick financial stats"""
+        colors = self.colors
         if not self.expenses:
             return
         
         try:
             # Calculate quick stats
-            total_spending = sum(float(expense['amount']) for expense in self.expenses)
+            total_spending = self._total_amount
             transaction_count = len(self.expenses)
             avg_transaction = total_spending / transaction_count if transaction_count > 0 else 0
             
             # This month's spending
-            current_month = datetime.now().replace(day=1)
-            this_month_expenses = [
-                expense for expense in self.expenses 
-                if datetime.strptime(expense['date'], '%Y-%m-%d') >= current_month
-            ]
-            this_month_total = sum(float(expense['amount']) for expense in this_month_expenses)
+            current_month = np.datetime64(datetime.now().strftime('%Y-%m'), 'D')
+            this_month_total = self._amounts[self._days >= current_month].sum()
             
             # Create stats cards
             stats_data = [
@@ -2387,19 +2951,29 @@ class ExpenseTracker:
                 ('📈', 'Total Transactions', f'{transaction_count}')
             ]
             
+            # Cards are built once; later refreshes only update their values, and only if any changed
+            if self.quick_stat_values:
+                if stats_data != self._last_quick_stats:
+                    for icon, label, value in stats_data:
+                        self.quick_stat_values[label].config(text=value)
+                    self._last_quick_stats = stats_data
+                return
+            self._last_quick_stats = stats_data
+            
             for icon, label, value in stats_data:
                 stat_frame = tk.Frame(self.quick_stats_frame, bg='#f8f9fa', relief='solid', bd=1)
                 stat_frame.pack(side='left', fill='both', expand=True, padx=2, pady=2)
                 
                 # Icon
                 icon_label = tk.Label(stat_frame, text=icon, font=('Segoe UI', 16), 
-                                     bg='#f8f9fa', fg=self.colors['primary'])
+                                     bg='#f8f9fa', fg=colors['primary'])
                 icon_label.pack(pady=(5, 0))
                 
                 # Value
                 value_label = tk.Label(stat_frame, text=value, font=('Segoe UI', 10, 'bold'),
-                                      bg='#f8f9fa', fg=self.colors['dark'])
+                                      bg='#f8f9fa', fg=colors['dark'])
                 value_label.pack()
+                self.quick_stat_values[label] = value_label
                 
                 # Label
                 label_label = tk.Label(stat_frame, text=label, font=('Segoe UI', 8),
@@ -2411,109 +2985,141 @@ class ExpenseTracker:
     
     def display_suggestion_error(self, error_msg):
         """Display error in suggestions panel"""
-        for widget in self.suggestions_container.winfo_children():
-            widget.destroy()
-        
-        error_label = tk.Label(self.suggestions_container,
-                              text=f"⚠️ Unable to generate suggestions: {error_msg}",
-                              font=('Segoe UI', 10),
-                              fg=self.colors['danger'],
-                              bg=self.colors['white'])
-        error_label.pack(pady=10)
+        self._show_suggestion_status(f"⚠️ Unable to generate suggestions: {error_msg}",
+                                     self.colors['danger'])
+    
+    def _ai_panel_visible(self):
+        """Return True if the AI panel is expanded and the window isn't minimized"""
+        return self.ai_expanded.get() and self.root.state() != 'iconic'
     
     def schedule_ai_updates(self):
-        """Schedule periodic AI suggestion updates"""
-        # Update suggestions every 30 seconds
-        self.root.after(30000, self.auto_update_suggestions)
+        """Schedule the next periodic AI suggestion update, replacing any pending one"""
+        if self._ai_after_id is not None:
+            self.root.after_cancel(self._ai_after_id)
+        interval = AI_REFRESH_MS if self._ai_panel_visible() else AI_IDLE_REFRESH_MS
+        self._ai_after_id = self.root.after(interval, self.auto_update_suggestions)
     
     def auto_update_suggestions(self):
         """Auto-update suggestions periodically"""
+        self._ai_after_id = None
         if hasattr(self, 'ai_panel') and self.ai_panel.winfo_exists():
-            self.update_ai_suggestions()
+            # Nobody can see the panel, so skip the refresh and check back less often
+            if self._ai_panel_visible():
+                self.update_ai_suggestions()
             self.schedule_ai_updates()  # Schedule next update
     
     def show_urgent_ai_notification(self, suggestion):
         """Show urgent AI notifications as popup banners"""
-        if suggestion.get('priority') not in ['danger', 'warning']:
+        if suggestion.priority not in ['danger', 'warning']:
             return
         
-        # Create notification banner
-        banner = tk.Toplevel(self.root)
-        banner.title("🚨 AI Alert")
-        banner.geometry("400x150")
-        banner.resizable(False, False)
-        banner.configure(bg=self.colors['danger'])
+        if self._urgent_banner is None:
+            self._build_urgent_banner()
+        banner = self._urgent_banner
+        
+        self._current_urgent = suggestion
+        self._urgent_title.config(text=f"{suggestion.icon} {suggestion.title}")
+        self._urgent_message.config(text=textwrap.fill(suggestion.message, URGENT_WRAP_CHARS))
+        self._urgent_action.config(text=suggestion.action or 'View Details')
         
         # Position in top-right corner
         banner.geometry("+{}+{}".format(
             self.root.winfo_x() + self.root.winfo_width() - 420,
             self.root.winfo_y() + 50
         ))
+        banner.deiconify()
+        
+        # Auto-dismiss after 10 seconds, counting from the latest alert
+        if self._urgent_after_id is not None:
+            banner.after_cancel(self._urgent_after_id)
+        self._urgent_after_id = banner.after(10000, self._hide_urgent_banner)
+    
+    def _build_urgent_banner(self):
+        """Create the urgent alert banner; show_urgent_ai_notification fills it in"""
+        colors = self.colors
+        banner = self._urgent_banner = tk.Toplevel(self.root)
+        banner.title("🚨 AI Alert")
+        banner.geometry("400x150")
+        banner.resizable(False, False)
+        banner.configure(bg=colors['danger'])
+        banner.protocol("WM_DELETE_WINDOW", self._hide_urgent_banner)
         
         # Make it stay on top
         banner.attributes('-topmost', True)
         
         # Content
-        content_frame = tk.Frame(banner, bg=self.colors['danger'])
+        content_frame = tk.Frame(banner, bg=colors['danger'])
         content_frame.pack(fill='both', expand=True, padx=15, pady=15)
         
         # Title
-        title_label = tk.Label(content_frame,
-                              text=f"{suggestion.get('icon', '🚨')} {suggestion.get('title', 'AI Alert')}",
-                              font=('Segoe UI', 12, 'bold'),
-                              fg='white',
-                              bg=self.colors['danger'])
-        title_label.pack(anchor='w')
+        self._urgent_title = tk.Label(content_frame,
+                                      font=('Segoe UI', 12, 'bold'),
+                                      fg='white',
+                                      bg=colors['danger'])
+        self._urgent_title.pack(anchor='w')
         
         # Message
-        message_label = tk.Label(content_frame,
-                                text=suggestion.get('message', ''),
-                                font=('Segoe UI', 10),
-                                fg='white',
-                                bg=self.colors['danger'],
-                                wraplength=350,
-                                justify='left')
-        message_label.pack(anchor='w', pady=(5, 10))
+        self._urgent_message = tk.Label(content_frame,
+                                        font=('Segoe UI', 10),
+                                        fg='white',
+                                        bg=colors['danger'],
+                                        justify='left')
+        self._urgent_message.pack(anchor='w', pady=(5, 10))
         
         # Buttons
-        btn_frame = tk.Frame(content_frame, bg=self.colors['danger'])
+        btn_frame = tk.Frame(content_frame, bg=colors['danger'])
         btn_frame.pack(fill='x')
         
-        action_btn = tk.Button(btn_frame,
-                              text=suggestion.get('action', 'View Details'),
-                              command=lambda: [self.handle_suggestion_action(suggestion), banner.destroy()],
-                              bg='white',
-                              fg=self.colors['danger'],
-                              font=('Segoe UI', 9, 'bold'),
-                              relief='flat',
-                              padx=15)
-        action_btn.pack(side='left')
+        self._urgent_action = tk.Button(btn_frame,
+                                        command=self._on_urgent_action,
+                                        bg='white',
+                                        fg=colors['danger'],
+                                        font=('Segoe UI', 9, 'bold'),
+                                        relief='flat',
+                                        padx=15)
+        self._urgent_action.pack(side='left')
         
         dismiss_btn = tk.Button(btn_frame,
                                text="Dismiss",
-                               command=banner.destroy,
-                               bg=self.colors['white'],
-                               fg=self.colors['dark'],
+                               command=self._hide_urgent_banner,
+                               bg=colors['white'],
+                               fg=colors['dark'],
                                font=('Segoe UI', 9),
                                relief='flat',
                                padx=15)
         dismiss_btn.pack(side='right')
-        
-        # Auto-dismiss after 10 seconds
-        banner.after(10000, banner.destroy)
+    
+    def _on_urgent_action(self):
+        """Run the shown alert's action and hide the banner"""
+        self.handle_suggestion_action(self._current_urgent)
+        self._hide_urgent_banner()
+    
+    def _hide_urgent_banner(self):
+        """Withdraw the urgent alert banner and cancel its auto-dismiss"""
+        if self._urgent_after_id is not None:
+            self._urgent_banner.after_cancel(self._urgent_after_id)
+            self._urgent_after_id = None
+        self._urgent_banner.withdraw()
     
     def check_for_urgent_alerts(self):
         """Check for urgent AI alerts and show notifications"""
         if not AI_FEATURES_AVAILABLE or not self.expenses:
             return
         
+        # Quick analysis for urgent alerts, shared with the suggestions panel
+        self._request_insights(self._show_urgent_alerts)
+    
+    def _show_urgent_alerts(self, future):
+        """Show the first danger-level suggestion from a finished insights analysis"""
         try:
-            # Quick analysis for urgent alerts
-            insights = self.financial_ai.analyze_spending_patterns(self.expenses)
-            suggestions = self.extract_actionable_suggestions(insights)
+            # The AI panel usually rendered this same analysis already; reuse its suggestions
+            if future is self._rendered_insights:
+                suggestions = self._current_suggestions
+            else:
+                suggestions = self.extract_actionable_suggestions(self._insights_result(future))
             
             for suggestion in suggestions:
-                if suggestion.get('priority') == 'danger':
+                if suggestion.priority == 'danger':
                     self.show_urgent_ai_notification(suggestion)
                     break  # Show only one urgent notification at a time
                     
@@ -7,11 +7,12 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import json
-import statistics
-from collections import defaultdict, Counter
+import os
+import pickle
+import hashlib
+from collections import defaultdict, Counter, OrderedDict
 
 try:
-    from sklearn.linear_model import LinearRegression
     from sklearn.ensemble import RandomForestRegressor
     from sklearn.preprocessing import StandardScaler
     import joblib
@@ -19,12 +20,20 @@ try:
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+INSIGHTS_CACHE_FILE = os.path.join(APP_DIR, "financial_ai_insights.pkl")
+# Most recent analyses kept in memory and in the on-disk insights cache
+INSIGHTS_CACHE_SIZE = 32
+# Bump whenever the analysis output changes, so cached insights from older code are dropped
+ANALYSIS_VERSION = 1
+
 class FinancialAI:
     def __init__(self):
         self.spending_model = None
         self.budget_model = None
         self.scaler = StandardScaler() if SKLEARN_AVAILABLE else None
-        self.insights_cache = {}
+        self.insights_cache = None  # expenses hash -> insights, loaded on first analysis
+        self.insights_cache_file = INSIGHTS_CACHE_FILE
         self.model_file = "financial_ai_model.pkl"
         
     def analyze_spending_patterns(self, expenses):
@@ -38,31 +47,49 @@ class FinancialAI:
                 'message': 'Need at least some expenses for analysis'
             }
         
+        # Hash and analyze the same copy, so the cache key always matches the data analyzed
+        expenses = list(expenses)
+        
         try:
+            key = self._expenses_key(expenses)
+            if self.insights_cache is None:
+                self.insights_cache = self._load_insights_cache()
+            if key in self.insights_cache:
+                self.insights_cache.move_to_end(key)
+                return dict(self.insights_cache[key], analysis_date=datetime.now().isoformat())
+            
             # Convert to DataFrame for easier analysis
             df = self._prepare_dataframe(expenses)
             
             if df.empty:
                 return {'status': 'no_valid_data'}
             
+            # Per-day totals and per-category stats shared by the analyzers below
+            daily_amounts = df.groupby('date_only')['amount'].sum()
+            category_stats = df.groupby('category', observed=True)['amount'].agg(['sum', 'mean', 'count', 'std'])
+            weekend_means = df.groupby('is_weekend')['amount'].mean()
+            
             # Core insights
             insights = {
                 'status': 'success',
                 'analysis_date': datetime.now().isoformat(),
                 'data_period': self._get_data_period(df),
-                'spending_summary': self._calculate_spending_summary(df),
-                'spending_trends': self._analyze_spending_trends(df),
-                'category_insights': self._analyze_categories(df),
-                'behavioral_patterns': self._analyze_behavioral_patterns(df),
-                'anomalies': self._detect_spending_anomalies(df),
-                'predictions': self._generate_predictions(df),
-                'recommendations': self._generate_ai_recommendations(df),
-                'financial_health': self._assess_financial_health(df),
+                'spending_summary': self._calculate_spending_summary(df, daily_amounts),
+                'spending_trends': self._analyze_spending_trends(df, daily_amounts, weekend_means),
+                'category_insights': self._analyze_categories(df, category_stats),
+                'behavioral_patterns': self._analyze_behavioral_patterns(df, daily_amounts),
+                'anomalies': self._detect_spending_anomalies(df, daily_amounts),
+                'predictions': self._generate_predictions(df, daily_amounts),
+                'recommendations': self._generate_ai_recommendations(df, daily_amounts, category_stats, weekend_means),
+                'financial_health': self._assess_financial_health(df, daily_amounts),
                 'goals_tracking': self._track_financial_goals(df)
             }
             
             # Cache insights for performance
-            self.insights_cache = insights
+            self.insights_cache[key] = insights
+            if len(self.insights_cache) > INSIGHTS_CACHE_SIZE:
+                self.insights_cache.popitem(last=False)
+            self._save_insights_cache()
             
             return insights
             
@@ -72,6 +99,35 @@ class FinancialAI:
                 'message': f'Analysis failed: {str(e)}'
             }
     
+    def _expenses_key(self, expenses):
+        """Hash the expense fields the analysis reads, together with ANALYSIS_VERSION"""
+        fields = [(e.get('date'), e.get('amount'), e.get('category'), e.get('description'))
+                  for e in expenses]
+        payload = json.dumps([ANALYSIS_VERSION, fields], default=str).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _load_insights_cache(self):
+        """Load previously computed insights from disk, dropping them if written by another analysis version"""
+        if os.path.exists(self.insights_cache_file):
+            try:
+                with open(self.insights_cache_file, 'rb') as f:
+                    cached = pickle.load(f)
+                if isinstance(cached, dict) and cached.get('version') == ANALYSIS_VERSION:
+                    return OrderedDict(cached['entries'])
+            except Exception as e:
+                print(f"Insights cache load error: {e}")
+        return OrderedDict()
+    
+    def _save_insights_cache(self):
+        """Write the insights cache to disk, replacing the old file atomically"""
+        tmp_path = self.insights_cache_file + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'version': ANALYSIS_VERSION, 'entries': self.insights_cache}, f)
+            os.replace(tmp_path, self.insights_cache_file)
+        except Exception as e:
+            print(f"Insights cache save error: {e}")
+    
     def _prepare_dataframe(self, expenses):
         """Convert expenses to pandas DataFrame with enriched features"""
         if not expenses:
@@ -96,18 +152,18 @@ class FinancialAI:
         if df.empty:
             return df
         
-        # Add time-based features
-        df['year'] = df['date'].dt.year
-        df['month'] = df['date'].dt.month
-        df['day'] = df['date'].dt.day
-        df['day_of_week'] = df['date'].dt.day_name()
-        df['week_of_year'] = df['date'].dt.isocalendar().week
-        df['is_weekend'] = df['date'].dt.weekday >= 5
-        df['day_of_month'] = df['date'].dt.day
+        # Few distinct values, so grouping on categorical codes beats hashing strings
+        df['category'] = df['category'].astype('category')
         
-        # Add derived features
-        df['amount_log'] = np.log1p(df['amount'])  # Log transform for skewed data
-        df['description_length'] = df['description'].str.len().fillna(0)
+        # Add time-based features, in the smallest integer types that hold them
+        df['year'] = df['date'].dt.year.astype('int16')
+        df['month'] = df['date'].dt.month.astype('uint8')
+        df['day'] = df['date'].dt.day.astype('uint8')
+        df['day_of_week'] = df['date'].dt.day_name().astype('category')
+        df['week_of_year'] = df['date'].dt.isocalendar().week.astype('uint8')
+        df['is_weekend'] = df['date'].dt.weekday >= 5
+        df['day_of_month'] = df['day']
+        df['date_only'] = df['date'].dt.normalize()  # Stays datetime64, unlike .dt.date
         
         # Sort by date
         df = df.sort_values('date')
@@ -130,13 +186,12 @@ class FinancialAI:
             'total_transactions': len(df)
         }
     
-    def _calculate_spending_summary(self, df):
+    def _calculate_spending_summary(self, df, daily_amounts):
         """Calculate comprehensive spending summary"""
         if df.empty:
             return {}
         
         total_amount = df['amount'].sum()
-        daily_amounts = df.groupby(df['date'].dt.date)['amount'].sum()
         
         summary = {
             'total_spending': float(total_amount),
@@ -156,58 +211,52 @@ class FinancialAI:
         
         return summary
     
-    def _analyze_spending_trends(self, df):
+    def _analyze_spending_trends(self, df, daily_amounts, weekend_means):
         """Analyze spending trends over time"""
         if df.empty or len(df) < 7:
             return {'status': 'insufficient_data'}
         
-        # Daily spending trend
-        daily_spending = df.groupby(df['date'].dt.date)['amount'].sum().reset_index()
-        daily_spending['days_since_start'] = range(len(daily_spending))
-        
         trends = {}
         
-        # Calculate trend using linear regression if available
-        if SKLEARN_AVAILABLE and len(daily_spending) >= 3:
-            try:
-                X = daily_spending[['days_since_start']]
-                y = daily_spending['amount']
-                
-                lr_model = LinearRegression()
-                lr_model.fit(X, y)
-                
-                slope = lr_model.coef_[0]
-                r_squared = lr_model.score(X, y)
-                
-                # Classify trend
-                if slope > 10:
-                    trend_direction = "increasing"
-                elif slope < -10:
-                    trend_direction = "decreasing"
-                else:
-                    trend_direction = "stable"
-                
-                trends['overall_trend'] = {
-                    'direction': trend_direction,
-                    'slope': float(slope),
-                    'strength': float(r_squared),
-                    'daily_change': float(slope)
-                }
-            except Exception:
-                trends['overall_trend'] = {'direction': 'unknown', 'slope': 0}
+        # Daily spending trend, fitted with closed-form least squares
+        if len(daily_amounts) >= 3:
+            y = daily_amounts.to_numpy(dtype=np.float64)
+            x = np.arange(len(y), dtype=np.float64)
+            x_dev = x - x.mean()
+            y_dev = y - y.mean()
+            
+            slope = (x_dev * y_dev).sum() / (x_dev ** 2).sum()
+            ss_res = ((y_dev - slope * x_dev) ** 2).sum()
+            ss_tot = (y_dev ** 2).sum()
+            r_squared = 1 - ss_res / ss_tot if ss_tot > 0 else 1.0
+            
+            # Classify trend
+            if slope > 10:
+                trend_direction = "increasing"
+            elif slope < -10:
+                trend_direction = "decreasing"
+            else:
+                trend_direction = "stable"
+            
+            trends['overall_trend'] = {
+                'direction': trend_direction,
+                'slope': float(slope),
+                'strength': float(r_squared),
+                'daily_change': float(slope)
+            }
         
         # Weekly patterns
-        weekly_avg = df.groupby('day_of_week')['amount'].mean().to_dict()
-        peak_day = max(weekly_avg, key=weekly_avg.get)
-        low_day = min(weekly_avg, key=weekly_avg.get)
+        weekly_avg = df.groupby('day_of_week', observed=True)['amount'].mean()
+        peak_day = weekly_avg.idxmax()
+        low_day = weekly_avg.idxmin()
         
         trends['weekly_patterns'] = {
-            'average_by_day': weekly_avg,
+            'average_by_day': weekly_avg.to_dict(),
             'peak_spending_day': peak_day,
             'lowest_spending_day': low_day,
             'weekend_vs_weekday': {
-                'weekend_avg': float(df[df['is_weekend']]['amount'].mean()) if len(df[df['is_weekend']]) > 0 else 0,
-                'weekday_avg': float(df[~df['is_weekend']]['amount'].mean()) if len(df[~df['is_weekend']]) > 0 else 0
+                'weekend_avg': float(weekend_means.get(True, 0)),
+                'weekday_avg': float(weekend_means.get(False, 0))
             }
         }
         
@@ -222,7 +271,7 @@ class FinancialAI:
         
         return trends
     
-    def _analyze_categories(self, df):
+    def _analyze_categories(self, df, category_stats):
         """Analyze spending by category"""
         if df.empty:
             return {}
@@ -230,7 +279,7 @@ class FinancialAI:
         category_analysis = {}
         
         # Basic category statistics
-        category_totals = df.groupby('category')['amount'].agg(['sum', 'mean', 'count', 'std']).fillna(0)
+        category_totals = category_stats.fillna(0)
         category_percentages = (category_totals['sum'] / category_totals['sum'].sum() * 100).round(2)
         
         for category in category_totals.index:
@@ -247,13 +296,10 @@ class FinancialAI:
         
         # Category trends
         category_trends = {}
-        for category in df['category'].unique():
-            cat_data = df[df['category'] == category]
-            if len(cat_data) >= 3:
-                daily_cat = cat_data.groupby(cat_data['date'].dt.date)['amount'].sum()
-                if len(daily_cat) >= 3:
-                    trend = self._calculate_simple_trend(daily_cat.values)
-                    category_trends[category] = trend
+        daily_by_category = df.groupby(['category', 'date_only'], observed=True)['amount'].sum()
+        for category, daily_cat in daily_by_category.groupby(level='category', observed=True):
+            if category_totals.loc[category, 'count'] >= 3 and len(daily_cat) >= 3:
+                category_trends[category] = self._calculate_simple_trend(daily_cat.values)
         
         return {
             'detailed_analysis': category_analysis,
@@ -262,7 +308,7 @@ class FinancialAI:
             'diversity_score': len(df['category'].unique()) / len(df) * 100  # How diverse spending is
         }
     
-    def _analyze_behavioral_patterns(self, df):
+    def _analyze_behavioral_patterns(self, df, daily_amounts):
         """Analyze behavioral spending patterns"""
         if df.empty:
             return {}
@@ -281,18 +327,16 @@ class FinancialAI:
             }
         
         # Spending burst detection
-        daily_totals = df.groupby(df['date'].dt.date)['amount'].sum()
-        high_spending_threshold = daily_totals.quantile(0.8)
-        high_spending_days = daily_totals[daily_totals > high_spending_threshold]
+        high_spending_threshold = daily_amounts.quantile(0.8)
+        high_spending_days = daily_amounts[daily_amounts > high_spending_threshold]
         
         patterns['spending_bursts'] = {
             'high_spending_days_count': len(high_spending_days),
             'average_burst_amount': float(high_spending_days.mean()) if len(high_spending_days) > 0 else 0,
-            'burst_frequency': len(high_spending_days) / len(daily_totals) * 100 if len(daily_totals) > 0 else 0
+            'burst_frequency': len(high_spending_days) / len(daily_amounts) * 100 if len(daily_amounts) > 0 else 0
         }
         
         # Consistency patterns
-        daily_amounts = df.groupby(df['date'].dt.date)['amount'].sum()
         patterns['spending_consistency'] = {
             'coefficient_of_variation': float(daily_amounts.std() / daily_amounts.mean()) if daily_amounts.mean() > 0 else 0,
             'regular_spender_score': self._calculate_regularity_score(daily_amounts)
@@ -300,7 +344,7 @@ class FinancialAI:
         
         return patterns
     
-    def _detect_spending_anomalies(self, df):
+    def _detect_spending_anomalies(self, df, daily_amounts):
         """Detect unusual spending patterns and outliers"""
         if df.empty or len(df) < 5:
             return {'status': 'insufficient_data'}
@@ -320,55 +364,53 @@ class FinancialAI:
         high_outliers = df[df['amount'] > outlier_threshold_high]
         low_outliers = df[df['amount'] < outlier_threshold_low]
         
+        largest = df.iloc[int(transaction_amounts.to_numpy().argmax())]
+        
         anomalies['transaction_outliers'] = {
             'high_value_transactions': len(high_outliers),
             'unusual_high_amounts': high_outliers[['date', 'amount', 'category', 'description']].to_dict('records') if len(high_outliers) <= 5 else [],
             'threshold_high': float(outlier_threshold_high),
             'largest_transaction': {
-                'amount': float(df.loc[df['amount'].idxmax(), 'amount']),
-                'date': df.loc[df['amount'].idxmax(), 'date'].strftime('%Y-%m-%d'),
-                'category': df.loc[df['amount'].idxmax(), 'category'],
-                'description': df.loc[df['amount'].idxmax(), 'description']
+                'amount': float(largest['amount']),
+                'date': largest['date'].strftime('%Y-%m-%d'),
+                'category': largest['category'],
+                'description': largest['description']
             }
         }
         
         # Daily spending anomalies
-        daily_spending = df.groupby(df['date'].dt.date)['amount'].sum()
-        daily_mean = daily_spending.mean()
-        daily_std = daily_spending.std()
+        daily_mean = daily_amounts.mean()
+        daily_std = daily_amounts.std()
         
         if daily_std > 0:
-            unusual_days = daily_spending[abs(daily_spending - daily_mean) > 2 * daily_std]
+            unusual_days = daily_amounts[abs(daily_amounts - daily_mean) > 2 * daily_std]
             anomalies['unusual_spending_days'] = {
                 'count': len(unusual_days),
-                'dates_and_amounts': {str(date): float(amount) for date, amount in unusual_days.items()}
+                'dates_and_amounts': {date.strftime('%Y-%m-%d'): float(amount) for date, amount in unusual_days.items()}
             }
         
-        # Category anomalies
-        category_stats = df.groupby('category')['amount'].agg(['mean', 'std'])
-        category_anomalies = []
-        
-        for _, row in df.iterrows():
-            category = row['category']
-            amount = row['amount']
-            
-            if category in category_stats.index:
-                cat_mean = category_stats.loc[category, 'mean']
-                cat_std = category_stats.loc[category, 'std']
-                
-                if cat_std > 0 and abs(amount - cat_mean) > 2 * cat_std:
-                    category_anomalies.append({
-                        'date': row['date'].strftime('%Y-%m-%d'),
-                        'category': category,
-                        'amount': float(amount),
-                        'expected_range': f"{cat_mean - cat_std:.0f} - {cat_mean + cat_std:.0f}"
-                    })
-        
-        anomalies['category_anomalies'] = category_anomalies[:5]  # Limit to 5 most recent
+        # Category anomalies: transactions more than 2 std away from their category's mean
+        category_amounts = df.groupby('category', observed=True)['amount']
+        cat_mean = category_amounts.transform('mean')
+        cat_std = category_amounts.transform('std')
+        outlier_mask = (cat_std > 0) & ((df['amount'] - cat_mean).abs() > 2 * cat_std)
+        outliers = df.loc[outlier_mask, ['date', 'category', 'amount']].head(5)  # Limit to 5
+        low = (cat_mean - cat_std).loc[outliers.index]
+        high = (cat_mean + cat_std).loc[outliers.index]
+        
+        category_anomalies = [{
+            'date': date.strftime('%Y-%m-%d'),
+            'category': category,
+            'amount': float(amount),
+            'expected_range': f"{lo:.0f} - {hi:.0f}"
+        } for date, category, amount, lo, hi in zip(outliers['date'], outliers['category'],
+                                                   outliers['amount'], low, high)]
+        
+        anomalies['category_anomalies'] = category_anomalies
         
         return anomalies
     
-    def _generate_predictions(self, df):
+    def _generate_predictions(self, df, daily_amounts):
         """Generate spending predictions using AI models"""
         if df.empty or len(df) < 7:
             return {'status': 'insufficient_data'}
@@ -377,8 +419,7 @@ class FinancialAI:
         
         try:
             # Prepare data for prediction
-            daily_spending = df.groupby(df['date'].dt.date)['amount'].sum().reset_index()
-            daily_spending = daily_spending.sort_values('date')
+            daily_spending = daily_amounts.reset_index()
             
             # Simple trend-based prediction
             recent_avg = daily_spending['amount'].tail(7).mean()  # Last 7 days average
@@ -392,7 +433,7 @@ class FinancialAI:
             }
             
             # Next week prediction
-            weekly_pattern = df.groupby('day_of_week')['amount'].mean()
+            weekly_pattern = df.groupby('day_of_week', observed=True)['amount'].mean()
             next_week_dates = pd.date_range(start=df['date'].max() + timedelta(days=1), periods=7)
             weekly_prediction = []
             
@@ -423,7 +464,7 @@ class FinancialAI:
         
         return predictions
     
-    def _generate_ai_recommendations(self, df):
+    def _generate_ai_recommendations(self, df, daily_amounts, category_stats, weekend_means):
         """Generate personalized AI recommendations"""
         if df.empty:
             return []
@@ -431,14 +472,13 @@ class FinancialAI:
         recommendations = []
         
         # Analyze spending patterns for recommendations
-        daily_avg = df.groupby(df['date'].dt.date)['amount'].sum().mean()
-        category_analysis = df.groupby('category')['amount'].sum().sort_values(ascending=False)
+        daily_avg = daily_amounts.mean()
+        category_analysis = category_stats['sum'].sort_values(ascending=False)
         top_category = category_analysis.index[0] if len(category_analysis) > 0 else "Unknown"
         top_category_amount = category_analysis.iloc[0] if len(category_analysis) > 0 else 0
         
         # High spending warning
-        recent_week = df[df['date'] >= df['date'].max() - timedelta(days=7)]
-        recent_avg = recent_week.groupby(recent_week['date'].dt.date)['amount'].sum().mean()
+        recent_avg = daily_amounts[daily_amounts.index >= df['date'].max() - timedelta(days=7)].mean()
         
         if recent_avg > daily_avg * 1.2:
             recommendations.append({
@@ -466,8 +506,8 @@ class FinancialAI:
                 })
         
         # Weekend vs weekday analysis
-        weekend_avg = df[df['is_weekend']]['amount'].mean() if len(df[df['is_weekend']]) > 0 else 0
-        weekday_avg = df[~df['is_weekend']]['amount'].mean() if len(df[~df['is_weekend']]) > 0 else 0
+        weekend_avg = weekend_means.get(True, 0)
+        weekday_avg = weekend_means.get(False, 0)
         
         if weekend_avg > weekday_avg * 1.5:
             recommendations.append({
@@ -480,7 +520,7 @@ class FinancialAI:
             })
         
         # Frequency recommendations
-        transaction_frequency = len(df) / len(df['date'].dt.date.unique())
+        transaction_frequency = len(df) / len(daily_amounts)
         if transaction_frequency > 5:  # More than 5 transactions per day on average
             recommendations.append({
                 'type': 'tip',
@@ -504,7 +544,7 @@ class FinancialAI:
         
         return recommendations
     
-    def _assess_financial_health(self, df):
+    def _assess_financial_health(self, df, daily_amounts):
         """Assess overall financial health based on spending patterns"""
         if df.empty:
             return {'score': 0, 'status': 'insufficient_data'}
@@ -513,7 +553,6 @@ class FinancialAI:
         factors = {}
         
         # Consistency factor (30 points)
-        daily_amounts = df.groupby(df['date'].dt.date)['amount'].sum()
         cv = daily_amounts.std() / daily_amounts.mean() if daily_amounts.mean() > 0 else 0
         consistency_score = max(0, 30 - (cv * 10))
         health_score -= (30 - consistency_score)
@@ -599,7 +638,7 @@ class FinancialAI:
         
         # Category-wise progress
         current_month_data = df[df['date'].dt.to_period('M') == df['date'].dt.to_period('M').iloc[-1]]
-        category_spending = current_month_data.groupby('category')['amount'].sum()
+        category_spending = current_month_data.groupby('category', observed=True)['amount'].sum()
         
         category_progress = {}
         for category, limit in simulated_goals['category_limits'].items():
@@ -623,13 +662,14 @@ class FinancialAI:
         if len(series) < 2:
             return 0
         
-        growth_rates = []
-        for i in range(1, len(series)):
-            if series.iloc[i-1] > 0:
-                growth_rate = (series.iloc[i] - series.iloc[i-1]) / series.iloc[i-1]
-                growth_rates.append(growth_rate)
+        values = series.to_numpy(dtype=np.float64)
+        previous, current = values[:-1], values[1:]
+        positive = previous > 0
+        if not positive.any():
+            return 0
         
-        return statistics.mean(growth_rates) if growth_rates else 0
+        growth_rates = (current[positive] - previous[positive]) / previous[positive]
+        return float(growth_rates.mean())
     
     def _calculate_simple_trend(self, values):
         """Calculate simple trend direction"""
@@ -684,28 +724,22 @@ class FinancialAI:
             
             # Features for model
             features = ['day_num', 'rolling_avg_7', 'rolling_avg_30']
-            X = daily_spending[features].fillna(method='ffill').fillna(method='bfill')
+            X = daily_spending[features].ffill().bfill()
             y = daily_spending['amount']
             
-            # Train model
-            model = RandomForestRegressor(n_estimators=50, random_state=42)
+            # Train model, with shallow trees since the series is short
+            model = RandomForestRegressor(n_estimators=50, max_depth=6, min_samples_leaf=3,
+                                          n_jobs=-1, random_state=42)
             model.fit(X, y)
             
-            # Predict next 7 days
-            last_row = X.iloc[-1:].copy()
-            predictions = []
-            
-            for i in range(7):
-                # Update features for next day
-                next_features = last_row.copy()
-                next_features['day_num'] += (i + 1)
-                
-                # Predict
-                pred = model.predict(next_features)[0]
-                predictions.append(max(0, pred))  # Ensure non-negative
-                
-                # Update rolling averages (simplified)
-                last_row = next_features
+            # Predict next 7 days in one call, holding the rolling averages at their last values
+            last_row = X.iloc[-1]
+            next_features = pd.DataFrame({
+                'day_num': last_row['day_num'] + np.arange(1, 8),
+                'rolling_avg_7': last_row['rolling_avg_7'],
+                'rolling_avg_30': last_row['rolling_avg_30']
+            })
+            predictions = np.clip(model.predict(next_features), 0, None)  # Ensure non-negative
             
             return {
                 'ml_predictions': {
@@ -284,7 +284,7 @@ class RealTimeDashboard:
                            f'₹{height:.0f}',
                            ha='center', va='bottom', fontsize=9)
             
-            self.overview_canvas.draw()
+            self.overview_canvas.draw_idle()
             
         except Exception as e:
             print(f"Error updating overview charts: {e}")
@@ -358,7 +358,7 @@ class RealTimeDashboard:
             ax3.legend()
             ax3.grid(True, alpha=0.3)
             
-            self.analytics_canvas.draw()
+            self.analytics_canvas.draw_idle()
             
         except Exception as e:
             print(f"Error updating analytics charts: {e}")
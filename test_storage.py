@@ -0,0 +1,76 @@
+"""
+Tests for expense storage: the JSON snapshot plus the append-only journal
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from expense_tracker import ExpenseTracker, append_json_line
+
+FOOD = {'date': '2024-01-01', 'amount': 250.0, 'category': 'Food', 'description': 'Lunch'}
+TAXI = {'date': '2024-01-02', 'amount': 120.0, 'category': 'Transportation', 'description': 'Taxi'}
+
+
+class StorageTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.data_file = os.path.join(self.tmp.name, 'expenses.json')
+        self.journal_file = os.path.join(self.tmp.name, 'expenses.jsonl')
+        # load_data/save_data only touch these attributes, so no Tk window is needed
+        self.tracker = SimpleNamespace(data_file=self.data_file, journal_file=self.journal_file,
+                                       corrupt_data_backup=None, _journal_dirty=False)
+
+    def write_snapshot(self, text):
+        with open(self.data_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def test_journal_is_folded_into_snapshot(self):
+        self.write_snapshot(json.dumps([FOOD]))
+        append_json_line(self.journal_file, TAXI)
+        with open(self.journal_file, 'ab') as f:
+            f.write(b'{"date": "2024-01-0')  # Torn line from an interrupted append
+
+        expenses = ExpenseTracker.load_data(self.tracker)
+
+        self.assertEqual(expenses, [FOOD, TAXI])
+        self.assertFalse(os.path.exists(self.journal_file))
+        with open(self.data_file, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [FOOD, TAXI])
+
+    def test_corrupt_snapshot_is_moved_aside_and_journal_kept(self):
+        self.write_snapshot('[{"date": "2024-01-01", "amo')
+        append_json_line(self.journal_file, TAXI)
+
+        expenses = ExpenseTracker.load_data(self.tracker)
+
+        self.assertEqual(expenses, [TAXI])
+        self.assertTrue(os.path.exists(self.journal_file))
+        self.assertFalse(os.path.exists(self.data_file))
+        with open(self.tracker.corrupt_data_backup, encoding='utf-8') as f:
+            self.assertEqual(f.read(), '[{"date": "2024-01-01", "amo')
+
+    def test_snapshot_that_is_not_a_list_counts_as_corrupt(self):
+        self.write_snapshot('{}')
+
+        self.assertEqual(ExpenseTracker.load_data(self.tracker), [])
+        self.assertIsNotNone(self.tracker.corrupt_data_backup)
+
+    def test_save_clears_journal(self):
+        append_json_line(self.journal_file, FOOD)
+        self.tracker.expenses = [FOOD]
+        self.tracker._journal_dirty = True
+
+        ExpenseTracker.save_data(self.tracker)
+
+        self.assertFalse(os.path.exists(self.journal_file))
+        self.assertFalse(self.tracker._journal_dirty)
+        with open(self.data_file, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), [FOOD])
+
+
+if __name__ == '__main__':
+    unittest.main()